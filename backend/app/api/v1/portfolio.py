@@ -1,10 +1,12 @@
 """Portfolio endpoints."""
 
 import math
+from bisect import bisect_right
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional
 
+import numpy as np
 import structlog
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select, func, or_
@@ -349,6 +351,29 @@ async def get_yield_history(
     }
 
 
+_RAO_DIVISOR = 1e9
+
+# Fear & greed index bands: below 25 is Extreme Fear, 75 and up Extreme Greed
+_SENTIMENT_THRESHOLDS = (25, 45, 55, 75)
+_SENTIMENT_LABELS = ("Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed")
+
+
+def _sentiment_label(index: float) -> str:
+    """Map a fear & greed index to its sentiment label."""
+    return _SENTIMENT_LABELS[bisect_right(_SENTIMENT_THRESHOLDS, index)]
+
+
+def _pool_float(pool: dict, key: str) -> float:
+    """Read a numeric TaoStats pool field, NaN when missing or invalid."""
+    val = pool.get(key)
+    if val is None:
+        return math.nan
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return math.nan
+
+
 async def _compute_market_pulse(
     positions: List[PositionSummary],
 ) -> Optional[MarketPulse]:
@@ -380,112 +405,69 @@ async def _compute_market_pulse(
     if total_value <= 0:
         return MarketPulse(taostats_available=True)
 
-    # Compute weighted averages
-    weighted_24h_change = 0.0
-    weighted_7d_change = 0.0
-    weighted_sentiment = 0.0
-    total_volume = 0.0
-    total_buy_volume = 0.0
-    total_sell_volume = 0.0
-    sentiment_weight_total = 0.0
-    top_mover_netuid = None
-    top_mover_name = None
-    top_mover_change = 0.0
+    # Compute weighted averages over held positions that have pool data.
+    # Missing or unparseable pool values become NaN and drop out of sums.
+    matched = [(pos, pool) for pos in positions if (pool := pool_lookup.get(pos.netuid))]
+    count = len(matched)
 
-    RAO_DIVISOR = 1e9
+    def _column(key: str) -> np.ndarray:
+        return np.fromiter(
+            (_pool_float(pool, key) for _, pool in matched), dtype=float, count=count
+        )
 
-    for pos in positions:
-        pool = pool_lookup.get(pos.netuid)
-        if not pool:
-            continue
+    weights = np.fromiter(
+        (float(pos.tao_value_mid) for pos, _ in matched), dtype=float, count=count
+    ) / total_value
+    changes_24h = _column("price_change_1_day")
+    fg_index = _column("fear_and_greed_index")
+
+    # Price changes (TaoStats uses _1_day, _1_week naming)
+    weighted_24h_change = float(np.nansum(weights * changes_24h))
+    weighted_7d_change = float(np.nansum(weights * _column("price_change_1_week")))
+
+    # Sentiment (TaoStats uses fear_and_greed_index)
+    has_sentiment = ~np.isnan(fg_index)
+    weighted_sentiment = float(np.sum(weights[has_sentiment] * fg_index[has_sentiment]))
+    sentiment_weight_total = float(np.sum(weights[has_sentiment]))
+
+    # Volume (TaoStats uses _24_hr suffix, values in rao)
+    total_volume = float(np.nansum(_column("tao_volume_24_hr"))) / _RAO_DIVISOR
+    total_buy_volume = float(np.nansum(_column("tao_buy_volume_24_hr"))) / _RAO_DIVISOR
+    total_sell_volume = float(np.nansum(_column("tao_sell_volume_24_hr"))) / _RAO_DIVISOR
 
-        pos_value = float(pos.tao_value_mid)
-        weight = pos_value / total_value if total_value > 0 else 0
-
-        # Price changes (TaoStats uses _1_day, _1_week naming)
-        change_24h = pool.get("price_change_1_day")
-        if change_24h is not None:
-            try:
-                change_24h = float(change_24h)
-                weighted_24h_change += weight * change_24h
-                # Track top mover
-                if abs(change_24h) > abs(top_mover_change):
-                    top_mover_change = change_24h
-                    top_mover_netuid = pos.netuid
-                    top_mover_name = pos.subnet_name
-            except (ValueError, TypeError):
-                pass
-
-        change_7d = pool.get("price_change_1_week")
-        if change_7d is not None:
-            try:
-                weighted_7d_change += weight * float(change_7d)
-            except (ValueError, TypeError):
-                pass
-
-        # Sentiment (TaoStats uses fear_and_greed_index)
-        fg_index = pool.get("fear_and_greed_index")
-        if fg_index is not None:
-            try:
-                weighted_sentiment += weight * float(fg_index)
-                sentiment_weight_total += weight
-            except (ValueError, TypeError):
-                pass
-
-        # Volume (TaoStats uses _24_hr suffix, values in rao)
-        vol_24h = pool.get("tao_volume_24_hr")
-        if vol_24h is not None:
-            try:
-                total_volume += float(vol_24h) / RAO_DIVISOR
-            except (ValueError, TypeError):
-                pass
-
-        buy_vol = pool.get("tao_buy_volume_24_hr")
-        if buy_vol is not None:
-            try:
-                total_buy_volume += float(buy_vol) / RAO_DIVISOR
-            except (ValueError, TypeError):
-                pass
-
-        sell_vol = pool.get("tao_sell_volume_24_hr")
-        if sell_vol is not None:
-            try:
-                total_sell_volume += float(sell_vol) / RAO_DIVISOR
-            except (ValueError, TypeError):
-                pass
+    # Top mover: first position with the largest non-zero absolute 24h change
+    top_mover_netuid = None
+    top_mover_name = None
+    top_mover_change = 0.0
+    # One argmax pass over |change|; NaN is zeroed in place so it never wins
+    abs_changes = np.abs(changes_24h)
+    abs_changes[np.isnan(abs_changes)] = 0.0
+    top_idx = int(abs_changes.argmax()) if count else 0
+    if count and abs_changes[top_idx] > 0:
+        top_pos = matched[top_idx][0]
+        top_mover_change = float(changes_24h[top_idx])
+        top_mover_netuid = top_pos.netuid
+        top_mover_name = top_pos.subnet_name
 
     # Determine sentiment label
     avg_sentiment = weighted_sentiment / sentiment_weight_total if sentiment_weight_total > 0 else None
-    sentiment_label = None
-    if avg_sentiment is not None:
-        if avg_sentiment >= 75:
-            sentiment_label = "Extreme Greed"
-        elif avg_sentiment >= 55:
-            sentiment_label = "Greed"
-        elif avg_sentiment >= 45:
-            sentiment_label = "Neutral"
-        elif avg_sentiment >= 25:
-            sentiment_label = "Fear"
-        else:
-            sentiment_label = "Extreme Fear"
+    sentiment_label = _sentiment_label(avg_sentiment) if avg_sentiment is not None else None
 
     # Net buy pressure
     net_buy_pressure = None
     if total_volume > 0:
-        net_buy_pressure = Decimal(str(
-            round((total_buy_volume - total_sell_volume) / total_volume * 100, 2)
-        ))
+        net_buy_pressure = round((total_buy_volume - total_sell_volume) / total_volume * 100, 2)
 
     return MarketPulse(
-        portfolio_24h_change_pct=Decimal(str(round(weighted_24h_change, 4))),
-        portfolio_7d_change_pct=Decimal(str(round(weighted_7d_change, 4))),
-        avg_sentiment_index=Decimal(str(round(avg_sentiment, 1))) if avg_sentiment is not None else None,
+        portfolio_24h_change_pct=round(weighted_24h_change, 4),
+        portfolio_7d_change_pct=round(weighted_7d_change, 4),
+        avg_sentiment_index=round(avg_sentiment, 1) if avg_sentiment is not None else None,
         avg_sentiment_label=sentiment_label,
-        total_volume_24h_tao=Decimal(str(round(total_volume, 4))) if total_volume > 0 else None,
+        total_volume_24h_tao=round(total_volume, 4) if total_volume > 0 else None,
         net_buy_pressure_pct=net_buy_pressure,
         top_mover_netuid=top_mover_netuid,
         top_mover_name=top_mover_name,
-        top_mover_change_24h=Decimal(str(round(top_mover_change, 4))) if top_mover_netuid else None,
+        top_mover_change_24h=round(top_mover_change, 4) if top_mover_netuid else None,
         taostats_available=True,
     )
 
@@ -32,7 +32,7 @@ async def get_signal_catalog() -> List[Dict[str, Any]]:
     """
     settings = get_settings()
 
-    if not getattr(settings, "enable_signal_endpoints", True):
+    if not settings.enable_signal_endpoints:
         raise HTTPException(
             status_code=403,
             detail="Signal endpoints are disabled"
@@ -65,7 +65,7 @@ async def run_signals(
     """
     settings = get_settings()
 
-    if not getattr(settings, "enable_signal_endpoints", True):
+    if not settings.enable_signal_endpoints:
         raise HTTPException(
             status_code=403,
             detail="Signal endpoints are disabled"
@@ -105,7 +105,7 @@ async def run_and_store_signals() -> Dict[str, Any]:
     """
     settings = get_settings()
 
-    if not getattr(settings, "enable_signal_endpoints", True):
+    if not settings.enable_signal_endpoints:
         raise HTTPException(
             status_code=403,
             detail="Signal endpoints are disabled"
@@ -128,7 +128,7 @@ async def get_latest_signals() -> Dict[str, Any]:
     """
     settings = get_settings()
 
-    if not getattr(settings, "enable_signal_endpoints", True):
+    if not settings.enable_signal_endpoints:
         raise HTTPException(
             status_code=403,
             detail="Signal endpoints are disabled"
@@ -157,7 +157,7 @@ async def get_signal_history(
     """
     settings = get_settings()
 
-    if not getattr(settings, "enable_signal_endpoints", True):
+    if not settings.enable_signal_endpoints:
         raise HTTPException(
             status_code=403,
             detail="Signal endpoints are disabled"
@@ -183,7 +183,7 @@ async def get_signal_definition(signal_id: str) -> Dict[str, Any]:
     """
     settings = get_settings()
 
-    if not getattr(settings, "enable_signal_endpoints", True):
+    if not settings.enable_signal_endpoints:
         raise HTTPException(
             status_code=403,
             detail="Signal endpoints are disabled"
@@ -1,32 +1,58 @@
 """Subnets endpoints."""
 
 import asyncio
+import hashlib
+import re
 import time
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.redis import cache
 from app.models.subnet import Subnet
 from app.schemas.subnet import (
     SubnetResponse,
     SubnetListResponse,
     EnrichedSubnetResponse,
     EnrichedSubnetListResponse,
+    SPARKLINE_PRICE_SCALE,
     VolatilePoolData,
     SparklinePoint,
     SubnetIdentity,
     DevActivity,
 )
+from app.services.data.response_models import parse_taostats_timestamp
 from app.services.data.taostats_client import taostats_client
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Enriched responses are served straight from cache while younger than
+# ENRICHED_FRESH_SECONDS; older entries are kept for ENRICHED_CACHE_TTL as
+# a fallback for when TaoStats is unreachable.
+ENRICHED_FRESH_SECONDS = 30
+ENRICHED_CACHE_TTL = timedelta(hours=1)
+
+# Extracted TaoStats pool data, cached on its own so it can turn over faster
+# than the DB-backed fields it is merged with.
+VOLATILE_CACHE_KEY = "taostats:pools:v2"
+VOLATILE_CACHE_TTL = timedelta(seconds=30)
+
+# Browsers may reuse an enriched response briefly, then must revalidate
+# with If-None-Match against its ETag.
+ENRICHED_CACHE_CONTROL = "max-age=15, must-revalidate"
+
+# Top-level cache_age_seconds member of a serialized enriched response
+_CACHE_AGE_RE = re.compile(r'"cache_age_seconds":(?:null|-?\d+)')
+
 
 @router.get("", response_model=SubnetListResponse)
 async def list_subnets(
@@ -100,6 +126,111 @@ async def list_subnets(
     )
 
 
+def _compact_sparkline(
+    points: List[SparklinePoint],
+) -> Optional[Tuple[List[float], int, int]]:
+    """Return (prices, start_ts, interval_s) for an evenly spaced series.
+
+    Samples land on block timestamps, so each may drift up to a tenth of
+    the interval from its slot. Returns None for irregular, unparseable or
+    single-point series.
+    """
+    if len(points) < 2:
+        return None
+    try:
+        stamps = [
+            int(parse_taostats_timestamp(pt["timestamp"]).replace(tzinfo=timezone.utc).timestamp())
+            for pt in points
+        ]
+    except (ValueError, AttributeError):
+        return None
+
+    start = stamps[0]
+    interval = round((stamps[-1] - start) / (len(stamps) - 1))
+    if interval <= 0:
+        return None
+    tolerance = interval / 10
+    if any(abs(ts - (start + i * interval)) > tolerance for i, ts in enumerate(stamps)):
+        return None
+    return [pt["price"] for pt in points], start, interval
+
+
+_RAO_DIVISOR = 1e9
+
+
+def _to_float(val) -> Optional[float]:
+    if val is None:
+        return None
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(val) -> Optional[int]:
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _rao_to_float(val) -> Optional[float]:
+    """Convert a rao value to a float token count."""
+    tokens = _to_float(val)
+    return tokens / _RAO_DIVISOR if tokens is not None else None
+
+
+def _str_or_none(val) -> Optional[str]:
+    return val if isinstance(val, str) else None
+
+
+_BOOL_ADAPTER = TypeAdapter(bool)
+
+
+def _bool_or_none(val) -> Optional[bool]:
+    """Coerce like a validated bool field ("true", 1, ...), None if invalid."""
+    if val is None or isinstance(val, bool):
+        return val
+    try:
+        return _BOOL_ADAPTER.validate_python(val)
+    except ValidationError:
+        return None
+
+
+# VolatilePoolData field -> (TaoStats pool key, converter)
+_VOLATILE_FIELDS: Dict[str, Tuple[str, Callable]] = {
+    "price_change_1h": ("price_change_1_hour", _to_float),
+    "price_change_24h": ("price_change_1_day", _to_float),
+    "price_change_7d": ("price_change_1_week", _to_float),
+    "price_change_30d": ("price_change_1_month", _to_float),
+    "high_24h": ("highest_price_24_hr", _to_float),
+    "low_24h": ("lowest_price_24_hr", _to_float),
+    "market_cap_change_24h": ("market_cap_change_1_day", _to_float),
+    "tao_volume_24h": ("tao_volume_24_hr", _rao_to_float),
+    "tao_buy_volume_24h": ("tao_buy_volume_24_hr", _rao_to_float),
+    "tao_sell_volume_24h": ("tao_sell_volume_24_hr", _rao_to_float),
+    "buys_24h": ("buys_24_hr", _to_int),
+    "sells_24h": ("sells_24_hr", _to_int),
+    "buyers_24h": ("buyers_24_hr", _to_int),
+    "sellers_24h": ("sellers_24_hr", _to_int),
+    "fear_greed_index": ("fear_and_greed_index", _to_float),
+    "fear_greed_sentiment": ("fear_and_greed_sentiment", _str_or_none),
+    "alpha_in_pool": ("alpha_in_pool", _rao_to_float),
+    "alpha_staked": ("alpha_staked", _rao_to_float),
+    "total_alpha": ("total_alpha", _rao_to_float),
+    "root_prop": ("root_prop", _to_float),
+    "startup_mode": ("startup_mode", _bool_or_none),
+}
+_VOLATILE_SOURCE_DEFAULTS = dict.fromkeys(key for key, _ in _VOLATILE_FIELDS.values())
+# One C-level batch read of every source key
+_get_volatile_sources = itemgetter(*(key for key, _ in _VOLATILE_FIELDS.values()))
+_VOLATILE_CONVERTERS = tuple(
+    (field, convert) for field, (_, convert) in _VOLATILE_FIELDS.items()
+)
+
+
 def _extract_volatile(pool_data: Dict) -> VolatilePoolData:
     """Extract volatile fields from a TaoStats pool record.
 
@@ -110,78 +241,45 @@ def _extract_volatile(pool_data: Dict) -> VolatilePoolData:
     - Sentiment: fear_and_greed_index, fear_and_greed_sentiment
     - Sparkline: seven_day_prices (list of {timestamp, price, block_number})
     - Alpha/pool values: returned as strings in rao (divide by 1e9 for tokens)
-    """
-    RAO_DIVISOR = 1e9
 
+    The scalar fields are mapped by _VOLATILE_FIELDS.
+    """
     # Parse sparkline data (TaoStats uses "seven_day_prices")
     sparkline_raw = pool_data.get("seven_day_prices") or []
     sparkline = None
     if sparkline_raw and isinstance(sparkline_raw, list):
         sparkline = [
             SparklinePoint(
-                timestamp=pt.get("timestamp", ""),
+                timestamp=str(pt.get("timestamp", "")),
                 price=float(pt.get("price", 0) or 0),
             )
             for pt in sparkline_raw
             if isinstance(pt, dict)
         ]
 
-    def _float(key: str) -> Optional[float]:
-        val = pool_data.get(key)
-        if val is None:
-            return None
-        try:
-            return float(val)
-        except (ValueError, TypeError):
-            return None
-
-    def _int(key: str) -> Optional[int]:
-        val = pool_data.get(key)
-        if val is None:
-            return None
-        try:
-            return int(val)
-        except (ValueError, TypeError):
-            return None
-
-    def _rao_to_float(key: str) -> Optional[float]:
-        """Convert a rao string value to float token count."""
-        val = pool_data.get(key)
-        if val is None:
-            return None
-        try:
-            return float(val) / RAO_DIVISOR
-        except (ValueError, TypeError):
-            return None
-
-    # TaoStats volume values are in rao - convert to TAO
-    tao_vol_raw = _float("tao_volume_24_hr")
-    tao_buy_vol_raw = _float("tao_buy_volume_24_hr")
-    tao_sell_vol_raw = _float("tao_sell_volume_24_hr")
-
-    return VolatilePoolData(
-        price_change_1h=_float("price_change_1_hour"),
-        price_change_24h=_float("price_change_1_day"),
-        price_change_7d=_float("price_change_1_week"),
-        price_change_30d=_float("price_change_1_month"),
-        high_24h=_float("highest_price_24_hr"),
-        low_24h=_float("lowest_price_24_hr"),
-        market_cap_change_24h=_float("market_cap_change_1_day"),
-        tao_volume_24h=tao_vol_raw / RAO_DIVISOR if tao_vol_raw is not None else None,
-        tao_buy_volume_24h=tao_buy_vol_raw / RAO_DIVISOR if tao_buy_vol_raw is not None else None,
-        tao_sell_volume_24h=tao_sell_vol_raw / RAO_DIVISOR if tao_sell_vol_raw is not None else None,
-        buys_24h=_int("buys_24_hr"),
-        sells_24h=_int("sells_24_hr"),
-        buyers_24h=_int("buyers_24_hr"),
-        sellers_24h=_int("sellers_24_hr"),
-        fear_greed_index=_float("fear_and_greed_index"),
-        fear_greed_sentiment=pool_data.get("fear_and_greed_sentiment"),
+    # Regularly sampled series ship as a bare array of integer micro-TAO
+    sparkline_prices_e6 = sparkline_start_ts = sparkline_interval_s = None
+    compact = _compact_sparkline(sparkline) if sparkline else None
+    if compact is not None:
+        prices, sparkline_start_ts, sparkline_interval_s = compact
+        sparkline_prices_e6 = [round(p * SPARKLINE_PRICE_SCALE) for p in prices]
+        sparkline = None
+
+    # Defaults first so keys missing from the pool read as None
+    raw = _get_volatile_sources(_VOLATILE_SOURCE_DEFAULTS | pool_data)
+    fields = {
+        field: convert(val)
+        for (field, convert), val in zip(_VOLATILE_CONVERTERS, raw)
+    }
+
+    # Every value is coerced above, so skip pydantic validation on this
+    # per-subnet path.
+    return VolatilePoolData.model_construct(
+        **fields,
         sparkline_7d=sparkline,
-        alpha_in_pool=_rao_to_float("alpha_in_pool"),
-        alpha_staked=_rao_to_float("alpha_staked"),
-        total_alpha=_rao_to_float("total_alpha"),
-        root_prop=_float("root_prop"),
-        startup_mode=pool_data.get("startup_mode"),
+        sparkline_prices_e6=sparkline_prices_e6,
+        sparkline_start_ts=sparkline_start_ts,
+        sparkline_interval_s=sparkline_interval_s,
     )
 
 
@@ -232,19 +330,171 @@ def _extract_dev_activity(activity_data: Dict) -> DevActivity:
     )
 
 
+async def _get_volatile_lookup() -> Dict[int, VolatilePoolData]:
+    """Get extracted pool data by netuid, from cache or a TaoStats fetch.
+
+    The scheduler normally keeps the cache warm (see
+    refresh_volatile_lookup), so the fetch only runs on a cold cache.
+    Raises whatever the pool fetch raises; cache errors fall through to
+    the fetch.
+    """
+    try:
+        cached = await cache.get(VOLATILE_CACHE_KEY)
+    except Exception as e:
+        logger.warning("Volatile cache read failed", error=str(e))
+        cached = None
+    if cached is not None:
+        return {
+            int(netuid): VolatilePoolData.model_construct(**data)
+            for netuid, data in cached.items()
+        }
+
+    return await refresh_volatile_lookup()
+
+
+async def refresh_volatile_lookup() -> Dict[int, VolatilePoolData]:
+    """Fetch TaoStats pool data, extract it by netuid and cache the result.
+
+    Runs on a scheduler interval so enriched requests rarely wait on
+    TaoStats. Raises whatever the pool fetch raises.
+    """
+    pool_response = await taostats_client.get_pools_full()
+    lookup: Dict[int, VolatilePoolData] = {}
+    for pool in pool_response.get("data", []):
+        netuid = pool.get("netuid")
+        if netuid is not None:
+            lookup[int(netuid)] = _extract_volatile(pool)
+
+    try:
+        await cache.set(
+            VOLATILE_CACHE_KEY,
+            {netuid: volatile.model_dump() for netuid, volatile in lookup.items()},
+            VOLATILE_CACHE_TTL,
+        )
+    except Exception as e:
+        logger.warning("Volatile cache write failed", error=str(e))
+    return lookup
+
+
+def _enriched_cache_key(eligible_only: bool) -> str:
+    """Cache key for an enriched subnet list response."""
+    return f"subnets:enriched:v3:eligible={int(eligible_only)}"
+
+
+async def _read_enriched_cache(key: str) -> Optional[Dict]:
+    """Read a cached enriched response; cache errors count as a miss."""
+    try:
+        return await cache.get_hash(key)
+    except Exception as e:
+        logger.warning("Enriched cache read failed", key=key, error=str(e))
+        return None
+
+
+def _compute_cache_age(generated_at: float, now: datetime) -> int:
+    """Whole seconds between a cache entry's generation and now."""
+    return int(now.timestamp() - generated_at)
+
+
+def _body_etag(body: str) -> str:
+    """Strong ETag for a serialized response body."""
+    digest = hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _with_cache_age(body: str, age: int) -> str:
+    """Rewrite cache_age_seconds in a serialized enriched response.
+
+    The envelope field serializes after the subnets array, and quotes inside
+    JSON strings are escaped, so the last match is always the envelope's.
+    """
+    match = _CACHE_AGE_RE.match(body, body.rfind('"cache_age_seconds":'))
+    if match is None:
+        return body
+    return f'{body[:match.start()]}"cache_age_seconds":{age}{body[match.end():]}'
+
+
+def _enriched_response(request: Request, body: str, etag: str) -> Response:
+    """Return body with its ETag, or a bare 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": ENRICHED_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _write_enriched_cache(
+    key: str, body: str, etag: str, generated_at: float
+) -> None:
+    """Store a serialized enriched response with its ETag and generation time."""
+    try:
+        await cache.set_hash(
+            key,
+            {"generated_at": generated_at, "etag": etag, "body": body},
+            ENRICHED_CACHE_TTL,
+        )
+    except Exception as e:
+        logger.warning("Enriched cache write failed", key=key, error=str(e))
+
+
 @router.get("/enriched", response_model=EnrichedSubnetListResponse)
 async def list_enriched_subnets(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     eligible_only: bool = Query(default=False),
-) -> EnrichedSubnetListResponse:
+):
     """List subnets enriched with volatile market data, identity, and dev activity.
 
+    Responses are cached for ENRICHED_FRESH_SECONDS, and cache hits report
+    their age in cache_age_seconds. If TaoStats pool data is unavailable on
+    rebuild, the last cached response is served instead with
+    taostats_available=False and cache_age_seconds set to its age.
+
+    Every response carries an ETag of its body; a matching If-None-Match
+    gets 304 Not Modified with no body.
+    """
+    now = datetime.now(timezone.utc)
+    key = _enriched_cache_key(eligible_only)
+    entry = await _read_enriched_cache(key)
+    age = _compute_cache_age(entry["generated_at"], now) if entry else None
+
+    if entry and age < ENRICHED_FRESH_SECONDS:
+        # The ETag was stored with the body, so this path never re-hashes.
+        # It covers the content as built; only the reported age moves.
+        body = _with_cache_age(entry["body"], age)
+        return _enriched_response(request, body, entry["etag"])
+
+    response = await _build_enriched_subnets(db, eligible_only)
+
+    if not response.taostats_available and entry:
+        logger.info("Serving stale enriched response", age_seconds=age)
+        response = EnrichedSubnetListResponse.model_validate_json(
+            entry["body"]
+        ).model_copy(update={"taostats_available": False, "cache_age_seconds": age})
+
+    # Serialize once with pydantic-core; the same body feeds the cache and
+    # bypasses FastAPI's response_model re-validation.
+    body = response.model_dump_json()
+    etag = _body_etag(body)
+    if response.taostats_available:
+        await _write_enriched_cache(key, body, etag, now.timestamp())
+    return _enriched_response(request, body, etag)
+
+
+async def _build_enriched_subnets(
+    db: AsyncSession,
+    eligible_only: bool,
+) -> EnrichedSubnetListResponse:
+    """Build the enriched subnet list from the DB and TaoStats.
+
     Merges stable DB data with live TaoStats data (pool: 2-min cache,
     identity/dev_activity: 30-min cache). All three TaoStats fetches run
     in parallel. Gracefully degrades per-source if any fetch fails.
     """
-    # 1. Query all subnets from DB
-    stmt = select(Subnet)
+    # 1. Query all subnets from DB, ranked first (nulls last)
+    stmt = select(Subnet).order_by(Subnet.rank.asc().nullslast())
     if eligible_only:
         stmt = stmt.where(Subnet.is_eligible == True)
 
@@ -262,7 +512,7 @@ async def list_enriched_subnets(
         fetch_start = time.monotonic()
 
         results = await asyncio.gather(
-            taostats_client.get_pools_full(),
+            _get_volatile_lookup(),
             taostats_client.get_subnet_identity(),
             taostats_client.get_dev_activity(),
             return_exceptions=True,
@@ -272,16 +522,12 @@ async def list_enriched_subnets(
         cache_age_seconds = int(fetch_elapsed) if fetch_elapsed > 1 else 0
 
         # Process pool data
-        pool_response = results[0]
-        if isinstance(pool_response, Exception):
+        pool_result = results[0]
+        if isinstance(pool_result, Exception):
             taostats_available = False
-            logger.warning("Pool data fetch failed", error=str(pool_response))
+            logger.warning("Pool data fetch failed", error=str(pool_result))
         else:
-            pools_data = pool_response.get("data", [])
-            for pool in pools_data:
-                netuid = pool.get("netuid")
-                if netuid is not None:
-                    volatile_lookup[int(netuid)] = _extract_volatile(pool)
+            volatile_lookup = pool_result
 
         # Process identity data (non-critical: log and continue)
         identity_response = results[1]
@@ -367,10 +613,8 @@ async def list_enriched_subnets(
             dev_activity=dev_activity_lookup.get(s.netuid),
         ))
 
-    # Sort by rank (nulls last)
-    enriched.sort(key=lambda x: (x.rank is None, x.rank or 0))
-
-    return EnrichedSubnetListResponse(
+    # Each item was validated when it was built; don't re-check the list
+    return EnrichedSubnetListResponse.model_construct(
         subnets=enriched,
         total=len(enriched),
         eligible_count=eligible_count,
@@ -1,6 +1,25 @@
 # Core module
-from app.core.config import get_settings, Settings
-from app.core.database import get_db, get_db_context, Base
-from app.core.redis import cache, get_redis
+#
+# Exports are resolved on first access (PEP 562) so that importing
+# app.core.config does not also load SQLAlchemy and redis.
+import importlib
+
+_EXPORTS = {
+    "get_settings": "app.core.config",
+    "Settings": "app.core.config",
+    "get_db": "app.core.database",
+    "get_db_context": "app.core.database",
+    "Base": "app.core.database",
+    "cache": "app.core.redis",
+    "get_redis": "app.core.redis",
+}
 
 __all__ = ["get_settings", "Settings", "get_db", "get_db_context", "Base", "cache", "get_redis"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
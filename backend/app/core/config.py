@@ -16,6 +16,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # API Keys and Wallet
@@ -297,6 +298,10 @@ class Settings(BaseSettings):
     wallet_refresh_minutes: int = Field(default=5)
     full_sync_minutes: int = Field(default=60)
     pools_refresh_minutes: int = Field(default=10)
+    volatile_refresh_seconds: int = Field(
+        default=20,
+        description="Interval for pre-warming the enriched-subnets pool data cache"
+    )
     flow_refresh_minutes: int = Field(default=30)
     validator_refresh_minutes: int = Field(default=60)
     slippage_refresh_hours: int = Field(default=24)
@@ -5,7 +5,7 @@ for the Trust Pack dashboard.
 """
 
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
@@ -137,7 +137,11 @@ class MetricsCollector:
     def __init__(self):
         self._lock = asyncio.Lock()
         self._api_metrics: Dict[str, APICallMetrics] = {}
-        self._cache_metrics: Dict[str, CacheMetrics] = {}
+        # Cache counters keyed by namespace; CacheMetrics is built on read
+        self._cache_hits: Counter = Counter()
+        self._cache_misses: Counter = Counter()
+        self._cache_sets: Counter = Counter()
+        self._cache_errors: Counter = Counter()
         self._dataset_status: Dict[str, DatasetSyncStatus] = {}
         self._started_at = datetime.now(timezone.utc)
 
@@ -147,7 +151,7 @@ class MetricsCollector:
 
     # ==================== API Metrics ====================
 
-    async def record_api_call(
+    def record_api_call(
         self,
         endpoint: str,
         latency_ms: float,
@@ -157,37 +161,40 @@ class MetricsCollector:
         retries: int = 0,
         request_id: Optional[str] = None,
     ) -> None:
-        """Record an API call result."""
-        async with self._lock:
-            if endpoint not in self._api_metrics:
-                self._api_metrics[endpoint] = APICallMetrics(endpoint=endpoint)
-
-            m = self._api_metrics[endpoint]
-            m.call_count += 1
-            m.total_latency_ms += latency_ms
-            m.retry_count += retries
-            m.last_call_at = datetime.now(timezone.utc)
-
-            if success:
-                m.success_count += 1
-            else:
-                m.error_count += 1
-                m.last_error = error_message
-                m.last_error_at = datetime.now(timezone.utc)
-
-                if status_code == 429:
-                    m.rate_limit_count += 1
-                elif status_code and status_code >= 500:
-                    m.server_error_count += 1
-
-                # Add to recent errors
-                self._recent_errors.append({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "endpoint": endpoint,
-                    "status_code": status_code,
-                    "error": error_message,
-                    "request_id": request_id,
-                })
+        """Record an API call result.
+
+        Synchronous so hot paths can record without awaiting or scheduling
+        a task; the update never yields, so it is atomic on the event loop.
+        """
+        if endpoint not in self._api_metrics:
+            self._api_metrics[endpoint] = APICallMetrics(endpoint=endpoint)
+
+        m = self._api_metrics[endpoint]
+        m.call_count += 1
+        m.total_latency_ms += latency_ms
+        m.retry_count += retries
+        m.last_call_at = datetime.now(timezone.utc)
+
+        if success:
+            m.success_count += 1
+        else:
+            m.error_count += 1
+            m.last_error = error_message
+            m.last_error_at = datetime.now(timezone.utc)
+
+            if status_code == 429:
+                m.rate_limit_count += 1
+            elif status_code and status_code >= 500:
+                m.server_error_count += 1
+
+            # Add to recent errors
+            self._recent_errors.append({
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "endpoint": endpoint,
+                "status_code": status_code,
+                "error": error_message,
+                "request_id": request_id,
+            })
 
         # Log structured
         log_data = {
@@ -233,48 +240,49 @@ class MetricsCollector:
 
     # ==================== Cache Metrics ====================
 
-    async def record_cache_hit(self, namespace: str = "default") -> None:
-        async with self._lock:
-            if namespace not in self._cache_metrics:
-                self._cache_metrics[namespace] = CacheMetrics(namespace=namespace)
-            self._cache_metrics[namespace].hit_count += 1
+    def record_cache_hit(self, namespace: str = "default") -> None:
+        self._cache_hits[namespace] += 1
 
-    async def record_cache_miss(self, namespace: str = "default") -> None:
-        async with self._lock:
-            if namespace not in self._cache_metrics:
-                self._cache_metrics[namespace] = CacheMetrics(namespace=namespace)
-            self._cache_metrics[namespace].miss_count += 1
+    def record_cache_miss(self, namespace: str = "default") -> None:
+        self._cache_misses[namespace] += 1
 
-    async def record_cache_set(self, namespace: str = "default") -> None:
-        async with self._lock:
-            if namespace not in self._cache_metrics:
-                self._cache_metrics[namespace] = CacheMetrics(namespace=namespace)
-            self._cache_metrics[namespace].set_count += 1
+    def record_cache_set(self, namespace: str = "default") -> None:
+        self._cache_sets[namespace] += 1
 
-    async def record_cache_error(self, namespace: str = "default") -> None:
-        async with self._lock:
-            if namespace not in self._cache_metrics:
-                self._cache_metrics[namespace] = CacheMetrics(namespace=namespace)
-            self._cache_metrics[namespace].error_count += 1
+    def record_cache_error(self, namespace: str = "default") -> None:
+        self._cache_errors[namespace] += 1
+
+    def _cache_namespaces(self) -> List[str]:
+        """All namespaces with at least one recorded cache event."""
+        return list(dict.fromkeys([
+            *self._cache_hits, *self._cache_misses,
+            *self._cache_sets, *self._cache_errors,
+        ]))
 
     def get_cache_metrics(self) -> Dict[str, Dict[str, Any]]:
         """Get all cache metrics."""
         return {
-            ns: m.to_dict()
-            for ns, m in self._cache_metrics.items()
+            ns: CacheMetrics(
+                namespace=ns,
+                hit_count=self._cache_hits[ns],
+                miss_count=self._cache_misses[ns],
+                set_count=self._cache_sets[ns],
+                error_count=self._cache_errors[ns],
+            ).to_dict()
+            for ns in self._cache_namespaces()
         }
 
     def get_cache_summary(self) -> Dict[str, Any]:
         """Get aggregated cache metrics summary."""
-        total_hits = sum(m.hit_count for m in self._cache_metrics.values())
-        total_misses = sum(m.miss_count for m in self._cache_metrics.values())
+        total_hits = sum(self._cache_hits.values())
+        total_misses = sum(self._cache_misses.values())
         total = total_hits + total_misses
 
         return {
             "total_hits": total_hits,
             "total_misses": total_misses,
             "overall_hit_rate": round(total_hits / total, 4) if total > 0 else 0,
-            "namespaces_tracked": len(self._cache_metrics),
+            "namespaces_tracked": len(self._cache_namespaces()),
         }
 
     # ==================== Dataset Sync Status ====================
@@ -432,7 +440,10 @@ class MetricsCollector:
         """Reset all metrics (for testing)."""
         async with self._lock:
             self._api_metrics.clear()
-            self._cache_metrics.clear()
+            self._cache_hits.clear()
+            self._cache_misses.clear()
+            self._cache_sets.clear()
+            self._cache_errors.clear()
             self._dataset_status.clear()
             self._recent_errors.clear()
             self._started_at = datetime.now(timezone.utc)
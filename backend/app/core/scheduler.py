@@ -94,6 +94,18 @@ async def _run_scheduled_sync(mode: str = "refresh") -> None:
         logger.error("Scheduled sync failed", mode=mode, error=str(e))
 
 
+async def _run_volatile_refresh() -> None:
+    """Pre-warm the enriched-subnets pool data cache."""
+    from app.api.v1.subnets import refresh_volatile_lookup
+
+    try:
+        lookup = await refresh_volatile_lookup()
+        logger.debug("Volatile pool cache refreshed", pool_count=len(lookup))
+    except Exception as e:
+        # The endpoint falls back to fetching, then to degraded mode
+        logger.warning("Volatile pool cache refresh failed", error=str(e))
+
+
 def _handle_rate_limit_backoff(retry_after: int | None = None) -> None:
     """Handle rate limit by backing off the scheduler.
 
@@ -142,6 +154,10 @@ def start_scheduler() -> None:
     - refresh: every wallet_refresh_minutes (5 min) — ~5 API calls, <3s
     - full: every full_sync_minutes (60 min) — ~130 API calls
     - deep: every slippage_refresh_hours (24h) — ~500+ API calls
+
+    Also pre-warms the enriched-subnets pool data cache every
+    volatile_refresh_seconds (20s); this mostly reads the client's 2-min
+    pools cache.
     """
     settings = get_settings()
     scheduler = get_scheduler()
@@ -187,12 +203,24 @@ def start_scheduler() -> None:
         coalesce=True,
     )
 
+    # Keep the enriched-subnets pool data cache warm off the request path
+    scheduler.add_job(
+        _run_volatile_refresh,
+        trigger=IntervalTrigger(seconds=settings.volatile_refresh_seconds),
+        id="volatile_pool_refresh",
+        name="Volatile Pool Cache Refresh",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
     scheduler.start()
     logger.info(
         "Scheduler started with three sync tiers",
         refresh_interval=f"{settings.wallet_refresh_minutes}m",
         full_interval=f"{settings.full_sync_minutes}m",
         deep_interval=f"{settings.slippage_refresh_hours}h",
+        volatile_interval=f"{settings.volatile_refresh_seconds}s",
     )
 
 
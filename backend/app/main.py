@@ -6,12 +6,14 @@ from datetime import datetime, timezone
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app import __version__
 from app.api.v1 import router as api_router
 from app.core.database import init_db, close_db
 from app.core.redis import close_redis
 from app.core.scheduler import start_scheduler, stop_scheduler
+from app.services.data.taostats_client import close_taostats_client
 
 logger = structlog.get_logger()
 
@@ -34,6 +36,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     stop_scheduler()
+    await close_taostats_client()
     await close_db()
     await close_redis()
     logger.info("Cleanup complete")
@@ -45,6 +48,7 @@ app = FastAPI(
     description="API for managing TAO treasury across Root and dTAO subnets",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
 )
@@ -171,16 +171,19 @@ class AlertSummary(BaseModel):
 
 
 class MarketPulse(BaseModel):
-    """Aggregated market data for held positions."""
-    portfolio_24h_change_pct: Optional[Decimal] = None
-    portfolio_7d_change_pct: Optional[Decimal] = None
-    avg_sentiment_index: Optional[Decimal] = None
+    """Aggregated market data for held positions.
+
+    Display-only figures computed from TaoStats floats, so they stay floats.
+    """
+    portfolio_24h_change_pct: Optional[float] = None
+    portfolio_7d_change_pct: Optional[float] = None
+    avg_sentiment_index: Optional[float] = None
     avg_sentiment_label: Optional[str] = None
-    total_volume_24h_tao: Optional[Decimal] = None
-    net_buy_pressure_pct: Optional[Decimal] = None
+    total_volume_24h_tao: Optional[float] = None
+    net_buy_pressure_pct: Optional[float] = None
     top_mover_netuid: Optional[int] = None
     top_mover_name: Optional[str] = None
-    top_mover_change_24h: Optional[Decimal] = None
+    top_mover_change_24h: Optional[float] = None
     taostats_available: bool = False
 
 
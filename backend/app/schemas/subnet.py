@@ -4,7 +4,8 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
 
 
 class SubnetResponse(BaseModel):
@@ -82,15 +83,25 @@ class SubnetListResponse(BaseModel):
 
 # ==================== Enriched Endpoint Schemas ====================
 
+# Sparkline prices go over the wire as integer micro-TAO
+SPARKLINE_PRICE_SCALE = 1_000_000
 
-class SparklinePoint(BaseModel):
-    """Single point in a sparkline series."""
+
+class SparklinePoint(TypedDict):
+    """Single point in a sparkline series.
+
+    A TypedDict rather than a model: up to 168 points are built per subnet
+    on every enriched request. Pydantic still validates them as part of
+    VolatilePoolData.
+    """
     timestamp: str
     price: float
 
 
 class VolatilePoolData(BaseModel):
     """Volatile market data passed through from TaoStats (not stored in DB)."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     price_change_1h: Optional[float] = None
     price_change_24h: Optional[float] = None
     price_change_7d: Optional[float] = None
@@ -107,7 +118,13 @@ class VolatilePoolData(BaseModel):
     sellers_24h: Optional[int] = None
     fear_greed_index: Optional[float] = None
     fear_greed_sentiment: Optional[str] = None
+    # Deprecated: only set when the 7d series is irregularly sampled
     sparkline_7d: Optional[List[SparklinePoint]] = None
+    # Compact 7d series: point i is at sparkline_start_ts + i * sparkline_interval_s,
+    # priced in TAO * price_scale (see EnrichedSubnetListResponse)
+    sparkline_prices_e6: Optional[List[int]] = None
+    sparkline_start_ts: Optional[int] = None
+    sparkline_interval_s: Optional[int] = None
     alpha_in_pool: Optional[float] = None
     alpha_staked: Optional[float] = None
     total_alpha: Optional[float] = None
@@ -212,8 +229,7 @@ class EnrichedSubnetResponse(BaseModel):
     # Dev activity (null when TaoStats unavailable)
     dev_activity: Optional[DevActivity] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class EnrichedSubnetListResponse(BaseModel):
@@ -223,3 +239,5 @@ class EnrichedSubnetListResponse(BaseModel):
     eligible_count: int
     taostats_available: bool = True
     cache_age_seconds: Optional[int] = None
+    # Divide sparkline_prices_e6 by this to get TAO prices
+    price_scale: int = SPARKLINE_PRICE_SCALE
@@ -23,6 +23,10 @@ from app.models.transaction import DelegationEvent, StakeTransaction
 
 logger = structlog.get_logger()
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_DAYS_PER_YEAR = Decimal("365")
+
 
 class EarningsService:
     """Service for computing earnings attribution."""
@@ -70,10 +74,10 @@ class EarningsService:
 
             # Compute earnings per netuid
             by_netuid = []
-            total_start_value = Decimal("0")
-            total_end_value = Decimal("0")
-            total_net_flows = Decimal("0")
-            total_earnings = Decimal("0")
+            total_start_value = _ZERO
+            total_end_value = _ZERO
+            total_net_flows = _ZERO
+            total_earnings = _ZERO
 
             for netuid in netuids:
                 result = await self._compute_netuid_earnings(
@@ -87,16 +91,16 @@ class EarningsService:
                 total_earnings += result["earnings_tao"]
 
             # Compute total metrics
-            total_earnings_pct = Decimal("0")
+            total_earnings_pct = _ZERO
             if total_start_value > 0:
-                total_earnings_pct = (total_earnings / total_start_value) * Decimal("100")
+                total_earnings_pct = (total_earnings / total_start_value) * _HUNDRED
 
             # Annualized APY estimate
             days = max((end - start).days, 1)
-            annualized_apy = Decimal("0")
+            annualized_apy = _ZERO
             if total_start_value > 0 and days > 0:
-                daily_rate = total_earnings / total_start_value / Decimal(str(days))
-                annualized_apy = daily_rate * Decimal("365") * Decimal("100")
+                daily_rate = total_earnings / total_start_value / Decimal(days)
+                annualized_apy = daily_rate * _DAYS_PER_YEAR * _HUNDRED
 
             return {
                 "wallet_address": wallet,
@@ -241,16 +245,16 @@ class EarningsService:
         earnings = end_value - start_value - net_flows
 
         # Compute percentage return
-        earnings_pct = Decimal("0")
+        earnings_pct = _ZERO
         if start_value > 0:
-            earnings_pct = (earnings / start_value) * Decimal("100")
+            earnings_pct = (earnings / start_value) * _HUNDRED
 
         # Annualized APY
         days = max((end - start).days, 1)
-        annualized_apy = Decimal("0")
+        annualized_apy = _ZERO
         if start_value > 0 and days > 0:
-            daily_rate = earnings / start_value / Decimal(str(days))
-            annualized_apy = daily_rate * Decimal("365") * Decimal("100")
+            daily_rate = earnings / start_value / Decimal(days)
+            annualized_apy = daily_rate * _DAYS_PER_YEAR * _HUNDRED
 
         return {
             "netuid": netuid,
@@ -323,7 +327,7 @@ class EarningsService:
             if position:
                 return position.tao_value_mid
 
-        return Decimal("0")
+        return _ZERO
 
     async def _get_net_flows(
         self,
@@ -350,7 +354,7 @@ class EarningsService:
         event_result = await db.execute(event_stmt)
         events = event_result.scalars().all()
 
-        net_flows = Decimal("0")
+        net_flows = _ZERO
         for event in events:
             if event.event_type == "stake":
                 net_flows += event.amount_tao
@@ -390,10 +394,10 @@ class EarningsService:
         """Compute earnings for a single time bucket."""
         netuids = await self._get_active_netuids(db, wallet, start, end)
 
-        total_start_value = Decimal("0")
-        total_end_value = Decimal("0")
-        total_net_flows = Decimal("0")
-        total_earnings = Decimal("0")
+        total_start_value = _ZERO
+        total_end_value = _ZERO
+        total_net_flows = _ZERO
+        total_earnings = _ZERO
 
         by_netuid = []
 
@@ -408,9 +412,9 @@ class EarningsService:
             if include_by_netuid:
                 by_netuid.append(result)
 
-        total_earnings_pct = Decimal("0")
+        total_earnings_pct = _ZERO
         if total_start_value > 0:
-            total_earnings_pct = (total_earnings / total_start_value) * Decimal("100")
+            total_earnings_pct = (total_earnings / total_start_value) * _HUNDRED
 
         result = {
             "total_start_value_tao": str(total_start_value),
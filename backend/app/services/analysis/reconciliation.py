@@ -21,6 +21,9 @@ from app.services.data.taostats_client import taostats_client
 
 logger = structlog.get_logger()
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
 
 class ReconciliationService:
     """Service for reconciling stored data vs live API data."""
@@ -68,8 +71,8 @@ class ReconciliationService:
             checks = []
             passed_checks = 0
             failed_checks = 0
-            total_stored_value = Decimal("0")
-            total_live_value = Decimal("0")
+            total_stored_value = _ZERO
+            total_live_value = _ZERO
 
             # Collect all netuids from both sources
             all_netuids = set(stored_positions.keys()) | set(live_positions.keys())
@@ -97,9 +100,9 @@ class ReconciliationService:
 
             # Compute total diff
             total_diff = total_live_value - total_stored_value
-            total_diff_pct = Decimal("0")
+            total_diff_pct = _ZERO
             if total_stored_value > 0:
-                total_diff_pct = (abs(total_diff) / total_stored_value) * Decimal("100")
+                total_diff_pct = (abs(total_diff) / total_stored_value) * _HUNDRED
 
             # Overall pass/fail
             overall_passed = failed_checks == 0
@@ -153,10 +156,10 @@ class ReconciliationService:
                     total_checks=0,
                     passed_checks=0,
                     failed_checks=0,
-                    total_stored_value_tao=Decimal("0"),
-                    total_live_value_tao=Decimal("0"),
-                    total_diff_tao=Decimal("0"),
-                    total_diff_pct=Decimal("0"),
+                    total_stored_value_tao=_ZERO,
+                    total_live_value_tao=_ZERO,
+                    total_diff_tao=_ZERO,
+                    total_diff_pct=_ZERO,
                     checks=[],
                     error_message=str(e),
                     absolute_tolerance_tao=absolute_tolerance,
@@ -296,9 +299,9 @@ class ReconciliationService:
         alpha_diff = live_alpha - stored_alpha
 
         # Calculate relative diff
-        relative_diff_pct = Decimal("0")
+        relative_diff_pct = _ZERO
         if stored_value > 0:
-            relative_diff_pct = (value_diff_abs / stored_value) * Decimal("100")
+            relative_diff_pct = (value_diff_abs / stored_value) * _HUNDRED
 
         # Determine if within tolerance
         within_absolute = value_diff_abs <= absolute_tolerance
@@ -1,5 +1,23 @@
 # Data services module
-from app.services.data.taostats_client import taostats_client, TaoStatsClient
-from app.services.data.data_sync import data_sync_service, DataSyncService
+#
+# Exports are resolved on first access (PEP 562) so that importing a light
+# submodule such as response_models does not pull in the HTTP client, the
+# sync service and their database/redis dependencies. The taostats_client
+# proxy is imported from its submodule, whose name it would shadow here.
+import importlib
 
-__all__ = ["taostats_client", "TaoStatsClient", "data_sync_service", "DataSyncService"]
+_EXPORTS = {
+    "TaoStatsClient": "app.services.data.taostats_client",
+    "data_sync_service": "app.services.data.data_sync",
+    "DataSyncService": "app.services.data.data_sync",
+}
+
+__all__ = ["TaoStatsClient", "data_sync_service", "DataSyncService"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -6,13 +6,22 @@ They don't need to capture every field - just the ones we use.
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
-import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 # ==================== Timestamp Parsing ====================
 
+_TIMESTAMP_FALLBACK_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
 def parse_taostats_timestamp(value: Any) -> Optional[datetime]:
     """Parse TaoStats timestamp which may come in multiple formats.
 
@@ -34,14 +43,13 @@ def parse_taostats_timestamp(value: Any) -> Optional[datetime]:
         return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
 
     if isinstance(value, str):
-        # Try multiple formats
         value = value.strip()
 
         # Handle Z suffix
-        if value.endswith("Z"):
+        if value[-1:] == "Z":
             value = value[:-1] + "+00:00"
 
-        # Try ISO format with timezone
+        # Fast path: ISO format, with or without timezone
         try:
             dt = datetime.fromisoformat(value)
             # Convert to naive UTC for consistency
@@ -51,33 +59,34 @@ def parse_taostats_timestamp(value: Any) -> Optional[datetime]:
         except ValueError:
             pass
 
-        # Try common formats without timezone
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S.%f",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ]
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-
-        # Try as numeric string (unix timestamp)
+        # Numeric string (unix timestamp) - checked before the strptime
+        # fallbacks so it doesn't have to fail through every format first
         try:
             return datetime.fromtimestamp(float(value), timezone.utc).replace(tzinfo=None)
         except (ValueError, OSError):
             pass
 
+        # Fallback: common formats without timezone
+        for fmt in _TIMESTAMP_FALLBACK_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+
     raise ValueError(f"Cannot parse timestamp: {value!r}")
 
 
 # ==================== Base Models ====================
 
+# Parsed API records are read-only snapshots: freezing them skips
+# assignment handling, and unknown fields from the API are dropped.
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+
 class TaoStatsAddress(BaseModel):
     """Address object from TaoStats API."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     ss58: str
     hex: Optional[str] = None
 
@@ -93,6 +102,8 @@ class TaoStatsAddress(BaseModel):
 
 class TaoStatsPagination(BaseModel):
     """Pagination info from TaoStats API."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     current_page: int = 1
     total_pages: int = 1
     total_items: int = 0
@@ -103,6 +114,8 @@ class TaoStatsPagination(BaseModel):
 
 class TaoStatsResponse(BaseModel):
     """Base response wrapper from TaoStats API."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     data: List[Any] = Field(default_factory=list)
     pagination: Optional[TaoStatsPagination] = None
 
@@ -120,6 +133,8 @@ class TaoStatsResponse(BaseModel):
 
 class SubnetPoolData(BaseModel):
     """Pool data from /api/dtao/pool/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     netuid: int
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
@@ -185,6 +200,8 @@ class SubnetPoolData(BaseModel):
 
 class SubnetData(BaseModel):
     """Subnet data from /api/subnet/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     netuid: int
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
@@ -238,6 +255,8 @@ class SubnetData(BaseModel):
 
 class StakeBalanceData(BaseModel):
     """Stake balance from /api/dtao/stake_balance/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
 
@@ -296,6 +315,8 @@ class StakeBalanceData(BaseModel):
 
 class DelegationEventData(BaseModel):
     """Delegation event from /api/delegation/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: Optional[str] = None
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
@@ -337,6 +358,8 @@ class DelegationEventData(BaseModel):
 
 class TradeData(BaseModel):
     """Trade data from /api/dtao/trade/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
     extrinsic_id: Optional[str] = None
@@ -377,6 +400,8 @@ class TradeData(BaseModel):
 
 class SlippageData(BaseModel):
     """Slippage calculation from /api/dtao/slippage/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     netuid: int
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
@@ -404,6 +429,8 @@ class SlippageData(BaseModel):
 
 class ValidatorData(BaseModel):
     """Validator data from /api/dtao/validator/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     hotkey: Optional[Any] = None
     coldkey: Optional[Any] = None
     name: Optional[str] = None
@@ -442,6 +469,8 @@ class ValidatorData(BaseModel):
 
 class ValidatorYieldData(BaseModel):
     """Validator yield from /api/dtao/validator/yield/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     hotkey: Optional[Any] = None
     netuid: Optional[int] = None
 
@@ -473,6 +502,8 @@ class ValidatorYieldData(BaseModel):
 
 class TaoPriceData(BaseModel):
     """TAO price from /api/price/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     asset: str = "tao"
     price: Optional[str] = None
     timestamp: Optional[datetime] = None
@@ -494,6 +525,8 @@ class TaoPriceData(BaseModel):
 
 class AccountData(BaseModel):
     """Account data from /api/account/latest/v1."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     address: Optional[str] = None
     block_number: Optional[int] = None
     timestamp: Optional[datetime] = None
@@ -528,6 +561,16 @@ class AccountData(BaseModel):
 
 # ==================== Response Validators ====================
 
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Get a cached TypeAdapter that validates a list of ``model`` items.
+
+    Validating the whole list in one call keeps the per-item loop inside
+    pydantic-core instead of calling model_validate() once per item.
+    """
+    return TypeAdapter(List[model])
+
+
 def validate_response(
     response_data: Dict[str, Any],
     expected_type: str = "list",
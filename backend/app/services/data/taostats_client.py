@@ -13,10 +13,12 @@ Phase 1 Hardening:
 """
 
 import asyncio
+import calendar
 import random
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from email.utils import parsedate
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import httpx
@@ -25,13 +27,29 @@ from pydantic import BaseModel, ValidationError
 
 from app.core.config import get_settings
 from app.core.redis import cache
+from app.services.data.response_models import list_adapter
 
 logger = structlog.get_logger()
 
+# Connection pool sizing for the shared HTTP client
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=300,
+)
+
+# Attempts beyond this reuse the last (capped) backoff delay
+BACKOFF_TABLE_SIZE = 32
+
 # Type var for generic response validation
 T = TypeVar("T", bound=BaseModel)
 
 
+def _epoch_isoformat(epoch_seconds: float) -> str:
+    """Format an epoch timestamp as ISO8601 UTC (for log output only)."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).isoformat()
+
+
 class TaoStatsError(Exception):
     """TaoStats API error."""
 
@@ -69,12 +87,48 @@ class TaoStatsClient:
 
     def __init__(self):
         settings = get_settings()
+        self._settings = settings  # Read once; consulted on every request/retry
         self.base_url = settings.taostats_base_url
         self.api_key = settings.taostats_api_key
         self.rate_limit = settings.taostats_rate_limit_per_minute
         self._request_times: List[datetime] = []
         self._lock = asyncio.Lock()
-        self._retry_after_until: Optional[datetime] = None  # Global rate limit state
+        self._retry_after_until: Optional[float] = None  # Global rate limit state (epoch seconds)
+        self._client: Optional[httpx.AsyncClient] = None  # Created on first request
+
+        # Capped exponential delays per attempt, so retries skip the pow()
+        self._backoff_table = tuple(
+            min(
+                settings.api_initial_backoff_seconds * (settings.api_backoff_multiplier ** i),
+                settings.api_max_backoff_seconds,
+            )
+            for i in range(BACKOFF_TABLE_SIZE)
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        A single long-lived client keeps connections alive between
+        requests instead of paying a TCP + TLS handshake on every call.
+        """
+        if self._client is None or self._client.is_closed:
+            settings = self._settings
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    connect=settings.api_connect_timeout_seconds,
+                    read=settings.api_read_timeout_seconds,
+                    write=10.0,
+                    pool=5.0,
+                ),
+                limits=HTTP_POOL_LIMITS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _headers(self) -> Dict[str, str]:
         """Get request headers with authorization."""
@@ -86,17 +140,16 @@ class TaoStatsClient:
 
     async def _check_rate_limit(self) -> None:
         """Check and enforce rate limiting (both local and server-signaled)."""
-        settings = get_settings()
+        settings = self._settings
 
         # Check if we're in a server-signaled rate limit period
-        if self._retry_after_until and settings.enable_retry_after:
-            now = datetime.utcnow()
-            if now < self._retry_after_until:
-                wait_time = (self._retry_after_until - now).total_seconds()
+        if self._retry_after_until is not None and settings.enable_retry_after:
+            wait_time = self._retry_after_until - time.time()
+            if wait_time > 0:
                 logger.warning(
                     "Waiting for Retry-After period",
                     wait_seconds=wait_time,
-                    until=self._retry_after_until.isoformat(),
+                    until=_epoch_isoformat(self._retry_after_until),
                 )
                 await asyncio.sleep(wait_time)
                 self._retry_after_until = None
@@ -135,33 +188,21 @@ class TaoStatsClient:
         except ValueError:
             pass
 
-        # Try as HTTP-date (RFC 7231)
-        try:
-            from email.utils import parsedate_to_datetime
-            dt = parsedate_to_datetime(retry_after)
-            delta = (dt - datetime.now(dt.tzinfo)).total_seconds()
-            return max(0, int(delta))
-        except (ValueError, TypeError):
-            pass
-
-        return None
+        # Try as HTTP-date (RFC 7231), compared as integer epoch seconds
+        parsed = parsedate(retry_after)
+        if parsed is None:
+            return None
+        return max(0, calendar.timegm(parsed) - int(time.time()))
 
     def _calculate_backoff(self, attempt: int) -> float:
         """Calculate backoff delay with jitter.
 
         Uses exponential backoff: base * multiplier^attempt + random jitter
         """
-        settings = get_settings()
-        base = settings.api_initial_backoff_seconds
-        multiplier = settings.api_backoff_multiplier
-        max_backoff = settings.api_max_backoff_seconds
-
-        delay = base * (multiplier ** attempt)
-        delay = min(delay, max_backoff)
+        delay = self._backoff_table[min(attempt, BACKOFF_TABLE_SIZE - 1)]
 
         # Add jitter (0-25% of delay)
-        jitter = random.uniform(0, 0.25 * delay)
-        return delay + jitter
+        return delay + random.random() * 0.25 * delay
 
     def _record_api_call(
         self,
@@ -170,29 +211,17 @@ class TaoStatsClient:
         latency_ms: float,
         status_code: Optional[int] = None,
     ) -> None:
-        """Record API call metrics (fire-and-forget async)."""
+        """Record API call metrics (synchronous, never raises)."""
         try:
-            settings = get_settings()
-            if settings.enable_api_metrics:
+            if self._settings.enable_api_metrics:
                 from app.core.metrics import get_metrics
 
-                async def _record():
-                    try:
-                        await get_metrics().record_api_call(
-                            endpoint=endpoint,
-                            success=success,
-                            latency_ms=latency_ms,
-                            status_code=status_code,
-                        )
-                    except Exception:
-                        pass
-
-                # Schedule as task if we're in an event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.create_task(_record())
-                except RuntimeError:
-                    pass  # No event loop, skip metrics
+                get_metrics().record_api_call(
+                    endpoint=endpoint,
+                    success=success,
+                    latency_ms=latency_ms,
+                    status_code=status_code,
+                )
         except Exception:
             pass  # Don't fail API calls due to metrics
 
@@ -223,7 +252,7 @@ class TaoStatsClient:
             TaoStatsRateLimitError: On rate limit (after retries exhausted)
             TaoStatsValidationError: On response validation failure
         """
-        settings = get_settings()
+        settings = self._settings
 
         # Check cache first
         if cache_key:
@@ -237,14 +266,7 @@ class TaoStatsClient:
         url = f"{self.base_url}{endpoint}"
         last_error: Optional[Exception] = None
         start_time = time.monotonic()
-
-        # Configure timeout
-        timeout = httpx.Timeout(
-            connect=settings.api_connect_timeout_seconds,
-            read=settings.api_read_timeout_seconds,
-            write=10.0,
-            pool=5.0,
-        )
+        client = self._get_client()
 
         for attempt in range(settings.api_max_retries + 1):
             try:
@@ -256,89 +278,86 @@ class TaoStatsClient:
                     params=params,
                 )
 
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=self._headers(),
-                        params=params,
-                    )
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=self._headers(),
+                    params=params,
+                )
 
-                    latency_ms = (time.monotonic() - start_time) * 1000
+                latency_ms = (time.monotonic() - start_time) * 1000
 
-                    # Handle rate limiting with Retry-After
-                    if response.status_code == 429:
-                        retry_after = self._parse_retry_after(response)
+                # Handle rate limiting with Retry-After
+                if response.status_code == 429:
+                    retry_after = self._parse_retry_after(response)
 
-                        if retry_after and settings.enable_retry_after:
-                            # Cap the wait time
-                            retry_after = min(retry_after, settings.retry_after_max_wait_seconds)
-                            self._retry_after_until = datetime.utcnow() + timedelta(seconds=retry_after)
+                    if retry_after and settings.enable_retry_after:
+                        # Cap the wait time
+                        retry_after = min(retry_after, settings.retry_after_max_wait_seconds)
+                        self._retry_after_until = time.time() + retry_after
 
-                            logger.warning(
-                                "Rate limit exceeded, Retry-After received",
-                                retry_after_seconds=retry_after,
-                                endpoint=endpoint,
-                            )
+                        logger.warning(
+                            "Rate limit exceeded, Retry-After received",
+                            retry_after_seconds=retry_after,
+                            endpoint=endpoint,
+                        )
 
-                            self._record_api_call(endpoint, False, latency_ms, 429)
+                        self._record_api_call(endpoint, False, latency_ms, 429)
 
-                            # If we have retries left, wait and retry
-                            if attempt < settings.api_max_retries:
-                                await asyncio.sleep(retry_after)
-                                start_time = time.monotonic()  # Reset for next attempt
-                                continue
+                        # If we have retries left, wait and retry
+                        if attempt < settings.api_max_retries:
+                            await asyncio.sleep(retry_after)
+                            start_time = time.monotonic()  # Reset for next attempt
+                            continue
 
-                        raise TaoStatsRateLimitError(
-                            "Rate limit exceeded",
-                            retry_after=retry_after,
-                        )
+                    raise TaoStatsRateLimitError(
+                        "Rate limit exceeded",
+                        retry_after=retry_after,
+                    )
 
-                    # Handle other errors
-                    if response.status_code != 200:
-                        self._record_api_call(endpoint, False, latency_ms, response.status_code)
-                        error_body = response.text[:500]
-                        logger.error(
-                            "API error",
-                            status=response.status_code,
+                # Handle other errors
+                if response.status_code != 200:
+                    self._record_api_call(endpoint, False, latency_ms, response.status_code)
+                    error_body = response.text[:500]
+                    logger.error(
+                        "API error",
+                        status=response.status_code,
+                        endpoint=endpoint,
+                        body=error_body,
+                    )
+                    raise TaoStatsError(
+                        f"API error {response.status_code}: {error_body}",
+                        status_code=response.status_code,
+                    )
+
+                # Success
+                data = response.json()
+                self._record_api_call(endpoint, True, latency_ms, 200)
+
+                # Validate response if model provided and validation enabled
+                if response_model and settings.enable_response_validation:
+                    try:
+                        # For list responses, validate the data array
+                        if "data" in data and isinstance(data["data"], list):
+                            list_adapter(response_model).validate_python(data["data"])
+                            # Keep original structure but could use validated data
+                        else:
+                            response_model.model_validate(data)
+                    except ValidationError as e:
+                        logger.warning(
+                            "Response validation warning",
                             endpoint=endpoint,
-                            body=error_body,
-                        )
-                        raise TaoStatsError(
-                            f"API error {response.status_code}: {error_body}",
-                            status_code=response.status_code,
+                            errors=str(e),
                         )
+                        # Don't fail on validation - just log warning
+                        # This allows graceful degradation if API changes
+
+                # Cache the result
+                if cache_key and cache_ttl:
+                    await cache.set(cache_key, data, cache_ttl)
+                    logger.debug("Cached response", key=cache_key, ttl_seconds=cache_ttl.total_seconds())
 
-                    # Success
-                    data = response.json()
-                    self._record_api_call(endpoint, True, latency_ms, 200)
-
-                    # Validate response if model provided and validation enabled
-                    if response_model and settings.enable_response_validation:
-                        try:
-                            # For list responses, validate the data array
-                            if "data" in data and isinstance(data["data"], list):
-                                validated_items = []
-                                for item in data["data"]:
-                                    validated_items.append(response_model.model_validate(item))
-                                # Keep original structure but could use validated data
-                            else:
-                                response_model.model_validate(data)
-                        except ValidationError as e:
-                            logger.warning(
-                                "Response validation warning",
-                                endpoint=endpoint,
-                                errors=str(e),
-                            )
-                            # Don't fail on validation - just log warning
-                            # This allows graceful degradation if API changes
-
-                    # Cache the result
-                    if cache_key and cache_ttl:
-                        await cache.set(cache_key, data, cache_ttl)
-                        logger.debug("Cached response", key=cache_key, ttl_seconds=cache_ttl.total_seconds())
-
-                    return data
+                return data
 
             except (httpx.HTTPError, httpx.TimeoutException) as e:
                 latency_ms = (time.monotonic() - start_time) * 1000
@@ -1213,10 +1232,9 @@ class TaoStatsClient:
         from consuming rate limit quota.
         """
         # Check if we're currently rate limited
-        if self._retry_after_until:
-            now = datetime.utcnow()
-            if now < self._retry_after_until:
-                logger.debug("Health check: rate limited", until=self._retry_after_until.isoformat())
+        if self._retry_after_until is not None:
+            if time.time() < self._retry_after_until:
+                logger.debug("Health check: rate limited", until=_epoch_isoformat(self._retry_after_until))
                 return False
 
         # Check if we've had recent successful requests (within last 5 minutes)
@@ -1255,6 +1273,12 @@ def get_taostats_client() -> TaoStatsClient:
     return _taostats_client
 
 
+async def close_taostats_client() -> None:
+    """Close the TaoStats client's HTTP connections, if it was created."""
+    if _taostats_client is not None:
+        await _taostats_client.aclose()
+
+
 # Backwards compatibility alias - will be resolved lazily
 class _LazyClient:
     """Lazy proxy for backwards compatibility with taostats_client usage."""
@@ -77,8 +77,8 @@ class SlippageCapacitySignal(BaseSignal):
         guardrails = []
         evidence: Dict[str, Any] = {}
 
-        # Get slippage threshold from settings (default 1%)
-        slippage_threshold = getattr(settings, "slippage_threshold_pct", Decimal("1.0"))
+        # Get slippage threshold from settings
+        slippage_threshold = settings.slippage_threshold_pct
 
         # Check guardrails
         guardrail_checker = GuardrailChecker()
@@ -49,6 +49,7 @@ from app.services.strategy.macro_regime_detector import (
     MacroRegime,
     MacroRegimeResult,
     MacroSignals,
+    MacroThresholds,
     MacroRegimeDetector,
     macro_regime_detector,
 )
@@ -93,6 +94,7 @@ __all__ = [
     "MacroRegime",
     "MacroRegimeResult",
     "MacroSignals",
+    "MacroThresholds",
     "MacroRegimeDetector",
     "macro_regime_detector",
     # Viability scoring
@@ -11,9 +11,10 @@ Implements hard excludes per spec:
 - Exit slippage exceeds caps
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -31,6 +32,20 @@ from app.services.strategy.regime_calculator import FlowRegime
 
 logger = structlog.get_logger()
 
+# Parallel (sizes, slippages) tuples, ascending by size
+SurfaceArrays = Tuple[Tuple[Decimal, ...], Tuple[Decimal, ...]]
+
+
+def _pack_surfaces(surfaces: Sequence[SlippageSurface]) -> SurfaceArrays:
+    """Split surfaces (ordered by size_tao) into parallel tuples for bisect.
+
+    Callers pack once per check and reuse the arrays for every lookup,
+    including each step of the max-size binary search.
+    """
+    sizes = tuple(s.size_tao for s in surfaces)
+    slips = tuple(s.slippage_pct for s in surfaces)
+    return sizes, slips
+
 
 class ExitabilityLevel(str, Enum):
     """Exitability severity levels for position slippage.
@@ -90,6 +105,10 @@ class EligibilityGate:
         self.exitability_warning_threshold = settings.exitability_warning_threshold  # 7.5% - warning tier
         self.enable_exitability_gate = settings.enable_exitability_gate  # Feature flag
 
+        # Minimum meaningful position (float: only used for the full-exit decision)
+        self._min_position_tao_f = float(settings.min_position_tao)
+        self._min_position_pct_f = float(settings.min_position_pct)
+
         # Validator quality thresholds
         self.min_vtrust = Decimal("0.5")  # Minimum validator trust
         self.max_validator_take = Decimal("0.20")  # Max validator take rate
@@ -224,8 +243,9 @@ class EligibilityGate:
         exit_50pct = target_size_tao * Decimal("0.5")
         exit_100pct = target_size_tao
 
-        slip_50 = self._interpolate_slippage(surfaces, exit_50pct)
-        slip_100 = self._interpolate_slippage(surfaces, exit_100pct)
+        arrays = _pack_surfaces(surfaces)
+        slip_50 = self._interpolate_packed(arrays, exit_50pct)
+        slip_100 = self._interpolate_packed(arrays, exit_100pct)
 
         if slip_50 > self.max_exit_slippage_50pct:
             return f"50% exit slippage too high: {float(slip_50):.1%} > {float(self.max_exit_slippage_50pct):.1%}"
@@ -244,29 +264,30 @@ class EligibilityGate:
         if not surfaces:
             return Decimal("0.10")  # Default high if no data
 
-        # Find bracketing surfaces
-        lower = None
-        upper = None
+        return self._interpolate_packed(_pack_surfaces(surfaces), size_tao)
+
+    @staticmethod
+    def _interpolate_packed(arrays: SurfaceArrays, size_tao: Decimal) -> Decimal:
+        """Interpolate slippage from packed surface arrays (must be non-empty)."""
+        sizes, slips = arrays
 
-        for s in surfaces:
-            if s.size_tao <= size_tao:
-                lower = s
-            if s.size_tao >= size_tao and upper is None:
-                upper = s
+        # Find bracketing surfaces: last size <= target, first size >= target
+        lower = bisect_right(sizes, size_tao) - 1
+        upper = bisect_left(sizes, size_tao)
 
-        if lower is None:
-            return surfaces[0].slippage_pct
+        if lower < 0:
+            return slips[0]
 
-        if upper is None:
+        if upper == len(sizes):
             # Extrapolate using largest cached size
-            return surfaces[-1].slippage_pct
+            return slips[-1]
 
-        if lower.size_tao == upper.size_tao:
-            return lower.slippage_pct
+        if sizes[lower] == sizes[upper]:
+            return slips[lower]
 
         # Linear interpolation
-        ratio = (size_tao - lower.size_tao) / (upper.size_tao - lower.size_tao)
-        slippage = lower.slippage_pct + ratio * (upper.slippage_pct - lower.slippage_pct)
+        ratio = (size_tao - sizes[lower]) / (sizes[upper] - sizes[lower])
+        slippage = slips[lower] + ratio * (slips[upper] - slips[lower])
         return slippage
 
     async def check_exitability(
@@ -312,8 +333,9 @@ class EligibilityGate:
         exit_50pct = position_size_tao * Decimal("0.5")
         exit_100pct = position_size_tao
 
-        slip_50 = self._interpolate_slippage(surfaces, exit_50pct)
-        slip_100 = self._interpolate_slippage(surfaces, exit_100pct)
+        arrays = _pack_surfaces(surfaces)
+        slip_50 = self._interpolate_packed(arrays, exit_50pct)
+        slip_100 = self._interpolate_packed(arrays, exit_100pct)
 
         # Determine level based on thresholds
         # Priority: FORCE_TRIM > BLOCK_BUY > WARNING > PASS
@@ -405,6 +427,8 @@ class EligibilityGate:
         if not surfaces:
             return None
 
+        arrays = _pack_surfaces(surfaces)
+
         # Binary search for max safe size
         # Search between 0 and current size
         low = Decimal("0")
@@ -419,7 +443,7 @@ class EligibilityGate:
                 break
 
             mid = (low + high) / 2
-            slip_100 = self._interpolate_slippage(surfaces, mid)
+            slip_100 = self._interpolate_packed(arrays, mid)
 
             if slip_100 <= target_slippage:
                 # This size is safe, try larger
@@ -430,22 +454,22 @@ class EligibilityGate:
                 high = mid
 
         # SAFETY GUARD: Check if safe size is below minimum meaningful position
-        settings = get_settings()
-        min_position_tao = settings.min_position_tao
+        min_position_tao = self._min_position_tao_f
 
         # If we have portfolio NAV, also check percentage-based minimum
         if portfolio_nav_tao and portfolio_nav_tao > 0:
-            min_position_pct_tao = portfolio_nav_tao * settings.min_position_pct
-            min_position_tao = max(min_position_tao, min_position_pct_tao)
+            min_position_tao = max(
+                min_position_tao, float(portfolio_nav_tao) * self._min_position_pct_f
+            )
 
-        if best_safe_size < min_position_tao:
+        if float(best_safe_size) < min_position_tao:
             # Safe size is below minimum meaningful position
             # Recommend full exit instead of leaving a micro position
             logger.info(
                 "Safe position size below minimum threshold, recommending full exit",
                 netuid=netuid,
                 safe_size=float(best_safe_size),
-                min_position=float(min_position_tao),
+                min_position=min_position_tao,
             )
             return None  # None signals full exit recommended
 
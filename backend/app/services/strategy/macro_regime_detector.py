@@ -22,7 +22,8 @@ Uses signals:
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Mapping, NamedTuple, Optional, Tuple
 from enum import Enum
 
 import structlog
@@ -35,6 +36,9 @@ from app.models.portfolio import PortfolioSnapshot, NAVHistory
 
 logger = structlog.get_logger()
 
+# Subnet flow regimes counted toward the macro risk-off share
+RISK_OFF_FLOW_REGIMES = frozenset({"risk_off", "quarantine", "dead"})
+
 
 class MacroRegime(str, Enum):
     """TAO macro market regime states.
@@ -59,17 +63,39 @@ class MacroRegimeResult:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MacroSignals:
-    """Aggregate signals for macro regime detection."""
-    aggregate_flow_7d: Decimal           # Sum of 7d taoflow across subnets
-    aggregate_flow_14d: Decimal          # Sum of 14d taoflow across subnets
-    drawdown_from_ath: Decimal           # Current portfolio drawdown
+    """Aggregate signals for macro regime detection.
+
+    Immutable once computed; built once per detection pass and only read
+    by the classifier.
+
+    Classifier inputs are floats: they are only compared against regime
+    thresholds, never used in settlement math. Decimal inputs are accepted
+    and converted on construction.
+    """
+    aggregate_flow_7d: float             # Sum of 7d taoflow across subnets
+    aggregate_flow_14d: float            # Sum of 14d taoflow across subnets
+    drawdown_from_ath: float             # Current portfolio drawdown
     regime_distribution: Dict[str, int]  # Count of subnets per flow regime
-    risk_off_pct: Decimal                # % of subnets in risk_off or worse
+    risk_off_pct: float                  # % of subnets in risk_off or worse
     total_subnets: int
     total_liquidity_tao: Decimal         # Sum of pool TAO across subnets
 
+    def __post_init__(self):
+        for name in ("aggregate_flow_7d", "aggregate_flow_14d", "drawdown_from_ath", "risk_off_pct"):
+            object.__setattr__(self, name, float(getattr(self, name)))
+
+
+class MacroThresholds(NamedTuple):
+    """Classification thresholds, loaded once from config."""
+    bull_flow_threshold: float
+    bear_flow_threshold: float
+    capitulation_flow_threshold: float
+    accumulation_drawdown_min: float
+    accumulation_drawdown_max: float
+    capitulation_drawdown: float
+
 
 class MacroRegimeDetector:
     """Detects TAO macro market regime from aggregate signals.
@@ -83,6 +109,58 @@ class MacroRegimeDetector:
     6. NEUTRAL: Default when signals are mixed
     """
 
+    # Policy per regime: built once, read-only, shared by every caller
+    _POLICIES: ClassVar[Mapping[MacroRegime, Mapping[str, Any]]] = MappingProxyType({
+        MacroRegime.BULL: MappingProxyType({
+            "sleeve_target": "upper",
+            "sleeve_modifier": Decimal("1.0"),  # Full sleeve
+            "new_positions_allowed": True,
+            "aggressive_rebalancing": True,
+            "root_bias": Decimal("0"),  # No extra root preference
+            "description": "Expand sleeve to upper bound. Aggressive accumulation allowed.",
+        }),
+        MacroRegime.ACCUMULATION: MappingProxyType({
+            "sleeve_target": "mid_upper",
+            "sleeve_modifier": Decimal("0.85"),  # 85% of max
+            "new_positions_allowed": True,
+            "aggressive_rebalancing": False,
+            "root_bias": Decimal("0.05"),  # Slight root preference
+            "description": "Good DCA zone. Measured accumulation in high-conviction subnets.",
+        }),
+        MacroRegime.NEUTRAL: MappingProxyType({
+            "sleeve_target": "mid",
+            "sleeve_modifier": Decimal("0.70"),  # 70% of max
+            "new_positions_allowed": True,
+            "aggressive_rebalancing": False,
+            "root_bias": Decimal("0.10"),  # Moderate root preference
+            "description": "Maintain current allocations. Wait for clearer signals.",
+        }),
+        MacroRegime.DISTRIBUTION: MappingProxyType({
+            "sleeve_target": "mid_lower",
+            "sleeve_modifier": Decimal("0.55"),  # 55% of max
+            "new_positions_allowed": False,
+            "aggressive_rebalancing": False,
+            "root_bias": Decimal("0.15"),  # Elevated root preference
+            "description": "Reduce exposure. No new positions. Favor exits to root.",
+        }),
+        MacroRegime.BEAR: MappingProxyType({
+            "sleeve_target": "lower",
+            "sleeve_modifier": Decimal("0.40"),  # 40% of max
+            "new_positions_allowed": False,
+            "aggressive_rebalancing": False,
+            "root_bias": Decimal("0.20"),  # Strong root preference
+            "description": "Defensive posture. Shrink sleeve toward minimum.",
+        }),
+        MacroRegime.CAPITULATION: MappingProxyType({
+            "sleeve_target": "minimum",
+            "sleeve_modifier": Decimal("0.25"),  # 25% of max
+            "new_positions_allowed": False,
+            "aggressive_rebalancing": False,
+            "root_bias": Decimal("0.25"),  # Maximum root preference
+            "description": "Max defensive. Preserve capital. Only hold highest conviction.",
+        }),
+    })
+
     def __init__(self):
         # Defer settings initialization to avoid import-time side effects
         settings = get_settings()
@@ -90,15 +168,17 @@ class MacroRegimeDetector:
 
         self.enabled = settings.enable_macro_regime_detection
 
-        # Flow thresholds
-        self.bull_flow_threshold = settings.macro_bull_flow_threshold
-        self.bear_flow_threshold = settings.macro_bear_flow_threshold
-        self.capitulation_flow_threshold = settings.macro_capitulation_flow_threshold
-
-        # Drawdown thresholds
-        self.accumulation_drawdown_min = settings.macro_accumulation_drawdown_min
-        self.accumulation_drawdown_max = settings.macro_accumulation_drawdown_max
-        self.capitulation_drawdown = settings.macro_capitulation_drawdown
+        # Thresholds (float: compared against float MacroSignals)
+        self.thresholds = MacroThresholds(
+            # Flow thresholds
+            bull_flow_threshold=float(settings.macro_bull_flow_threshold),
+            bear_flow_threshold=float(settings.macro_bear_flow_threshold),
+            capitulation_flow_threshold=float(settings.macro_capitulation_flow_threshold),
+            # Drawdown thresholds
+            accumulation_drawdown_min=float(settings.macro_accumulation_drawdown_min),
+            accumulation_drawdown_max=float(settings.macro_accumulation_drawdown_max),
+            capitulation_drawdown=float(settings.macro_capitulation_drawdown),
+        )
 
         # Lookback period
         self.lookback_days = settings.macro_regime_lookback_days
@@ -141,19 +221,17 @@ class MacroRegimeDetector:
             aggregate_flow_7d = Decimal("0")
             aggregate_flow_14d = Decimal("0")
 
-        # Regime distribution
+        # Regime distribution and risk-off count (risk_off, quarantine, dead)
+        # in a single pass over subnets
         regime_counts: Dict[str, int] = {}
+        risk_off_count = 0
         for subnet in subnets:
             regime = subnet.flow_regime or "neutral"
             regime_counts[regime] = regime_counts.get(regime, 0) + 1
+            if regime in RISK_OFF_FLOW_REGIMES:
+                risk_off_count += 1
 
-        # Calculate risk-off percentage (risk_off, quarantine, dead)
-        risk_off_count = (
-            regime_counts.get("risk_off", 0) +
-            regime_counts.get("quarantine", 0) +
-            regime_counts.get("dead", 0)
-        )
-        risk_off_pct = Decimal(str(risk_off_count / len(subnets))) if subnets else Decimal("0")
+        risk_off_pct = risk_off_count / len(subnets)
 
         # Get portfolio drawdown from most recent snapshot
         drawdown = await self._get_portfolio_drawdown(db)
@@ -234,88 +312,66 @@ class MacroRegimeDetector:
 
         # Build signal dict for debugging/logging
         signal_dict = {
-            "aggregate_flow_7d": float(flow_7d),
-            "aggregate_flow_14d": float(flow_14d),
-            "drawdown_from_ath": float(drawdown),
-            "risk_off_pct": float(risk_off_pct),
+            "aggregate_flow_7d": flow_7d,
+            "aggregate_flow_14d": flow_14d,
+            "drawdown_from_ath": drawdown,
+            "risk_off_pct": risk_off_pct,
             "total_subnets": signals.total_subnets,
             "regime_distribution": signals.regime_distribution,
         }
 
+        # Unpack thresholds once and evaluate the shared predicate up front
+        (bull_flow, bear_flow, capitulation_flow,
+         accumulation_min, accumulation_max, capitulation_drawdown) = self.thresholds
+        near_highs = drawdown < accumulation_min
+
         # 1. CAPITULATION: Severe drawdown + severe outflow
-        if (drawdown >= self.capitulation_drawdown and
-            flow_7d <= self.capitulation_flow_threshold):
-            return MacroRegimeResult(
-                regime=MacroRegime.CAPITULATION,
-                confidence="high",
-                reason=f"Severe drawdown ({float(drawdown):.1%}) with panic outflows ({float(flow_7d):.1%} 7d flow)",
-                signals=signal_dict,
-                timestamp=now,
-            )
+        if drawdown >= capitulation_drawdown and flow_7d <= capitulation_flow:
+            regime = MacroRegime.CAPITULATION
+            confidence = "high"
+            reason = f"Severe drawdown ({drawdown:.1%}) with panic outflows ({flow_7d:.1%} 7d flow)"
 
         # 2. BULL: Strong inflows + low drawdown
-        if (flow_7d >= self.bull_flow_threshold and
-            flow_14d >= 0 and
-            drawdown < self.accumulation_drawdown_min):
-            confidence = "high" if flow_14d >= self.bull_flow_threshold else "medium"
-            return MacroRegimeResult(
-                regime=MacroRegime.BULL,
-                confidence=confidence,
-                reason=f"Strong inflows ({float(flow_7d):.1%} 7d) with low drawdown ({float(drawdown):.1%})",
-                signals=signal_dict,
-                timestamp=now,
-            )
+        elif flow_7d >= bull_flow and flow_14d >= 0 and near_highs:
+            regime = MacroRegime.BULL
+            confidence = "high" if flow_14d >= bull_flow else "medium"
+            reason = f"Strong inflows ({flow_7d:.1%} 7d) with low drawdown ({drawdown:.1%})"
 
         # 3. BEAR: Moderate outflows OR high risk-off concentration
-        if flow_7d <= self.bear_flow_threshold:
-            confidence = "high" if flow_14d <= self.bear_flow_threshold else "medium"
-            return MacroRegimeResult(
-                regime=MacroRegime.BEAR,
-                confidence=confidence,
-                reason=f"Negative flows ({float(flow_7d):.1%} 7d, {float(flow_14d):.1%} 14d)",
-                signals=signal_dict,
-                timestamp=now,
-            )
+        elif flow_7d <= bear_flow:
+            regime = MacroRegime.BEAR
+            confidence = "high" if flow_14d <= bear_flow else "medium"
+            reason = f"Negative flows ({flow_7d:.1%} 7d, {flow_14d:.1%} 14d)"
 
-        if risk_off_pct >= Decimal("0.40"):  # 40%+ subnets in risk-off or worse
-            return MacroRegimeResult(
-                regime=MacroRegime.BEAR,
-                confidence="medium",
-                reason=f"High risk-off concentration ({float(risk_off_pct):.0%} of subnets)",
-                signals=signal_dict,
-                timestamp=now,
-            )
+        elif risk_off_pct >= 0.40:  # 40%+ subnets in risk-off or worse
+            regime = MacroRegime.BEAR
+            confidence = "medium"
+            reason = f"High risk-off concentration ({risk_off_pct:.0%} of subnets)"
 
         # 4. ACCUMULATION: In drawdown zone with stabilizing flows
-        if (self.accumulation_drawdown_min <= drawdown <= self.accumulation_drawdown_max and
-            flow_7d >= self.bear_flow_threshold):  # Not in severe outflow
+        # (flow_7d > bear_flow is already guaranteed by the BEAR check)
+        elif accumulation_min <= drawdown <= accumulation_max:
+            regime = MacroRegime.ACCUMULATION
             confidence = "high" if flow_7d >= 0 else "medium"
-            return MacroRegimeResult(
-                regime=MacroRegime.ACCUMULATION,
-                confidence=confidence,
-                reason=f"Drawdown zone ({float(drawdown):.1%}) with stabilizing flows ({float(flow_7d):.1%})",
-                signals=signal_dict,
-                timestamp=now,
-            )
+            reason = f"Drawdown zone ({drawdown:.1%}) with stabilizing flows ({flow_7d:.1%})"
 
         # 5. DISTRIBUTION: Low drawdown but negative/flat flows
         # Decelerating = recent (7d) weaker than longer average (14d)
-        if (drawdown < self.accumulation_drawdown_min and
-            self.bear_flow_threshold < flow_7d < self.bull_flow_threshold and
-            flow_7d < flow_14d):  # Decelerating flows (7d weaker than 14d)
-            return MacroRegimeResult(
-                regime=MacroRegime.DISTRIBUTION,
-                confidence="medium",
-                reason=f"Near highs ({float(drawdown):.1%} drawdown) but decelerating flows (7d: {float(flow_7d):.1%}, 14d: {float(flow_14d):.1%})",
-                signals=signal_dict,
-                timestamp=now,
-            )
+        elif near_highs and flow_7d < bull_flow and flow_7d < flow_14d:
+            regime = MacroRegime.DISTRIBUTION
+            confidence = "medium"
+            reason = f"Near highs ({drawdown:.1%} drawdown) but decelerating flows (7d: {flow_7d:.1%}, 14d: {flow_14d:.1%})"
 
         # 6. NEUTRAL: Default for mixed signals
+        else:
+            regime = MacroRegime.NEUTRAL
+            confidence = "low"
+            reason = f"Mixed signals (flow: {flow_7d:.1%}, drawdown: {drawdown:.1%})"
+
         return MacroRegimeResult(
-            regime=MacroRegime.NEUTRAL,
-            confidence="low",
-            reason=f"Mixed signals (flow: {float(flow_7d):.1%}, drawdown: {float(drawdown):.1%})",
+            regime=regime,
+            confidence=confidence,
+            reason=reason,
             signals=signal_dict,
             timestamp=now,
         )
@@ -346,13 +402,13 @@ class MacroRegimeDetector:
                 regime=result.regime.value,
                 confidence=result.confidence,
                 reason=result.reason,
-                flow_7d=float(signals.aggregate_flow_7d),
-                drawdown=float(signals.drawdown_from_ath),
+                flow_7d=signals.aggregate_flow_7d,
+                drawdown=signals.drawdown_from_ath,
             )
 
             return result
 
-    def get_regime_policy(self, regime: MacroRegime) -> Dict[str, any]:
+    def get_regime_policy(self, regime: MacroRegime) -> Mapping[str, Any]:
         """Get portfolio policy adjustments for a given macro regime.
 
         Returns target sleeve bounds and strategy adjustments.
@@ -361,60 +417,9 @@ class MacroRegimeDetector:
             regime: The macro regime
 
         Returns:
-            Dict with policy parameters
+            Read-only mapping with policy parameters
         """
-        policies = {
-            MacroRegime.BULL: {
-                "sleeve_target": "upper",
-                "sleeve_modifier": Decimal("1.0"),  # Full sleeve
-                "new_positions_allowed": True,
-                "aggressive_rebalancing": True,
-                "root_bias": Decimal("0"),  # No extra root preference
-                "description": "Expand sleeve to upper bound. Aggressive accumulation allowed.",
-            },
-            MacroRegime.ACCUMULATION: {
-                "sleeve_target": "mid_upper",
-                "sleeve_modifier": Decimal("0.85"),  # 85% of max
-                "new_positions_allowed": True,
-                "aggressive_rebalancing": False,
-                "root_bias": Decimal("0.05"),  # Slight root preference
-                "description": "Good DCA zone. Measured accumulation in high-conviction subnets.",
-            },
-            MacroRegime.NEUTRAL: {
-                "sleeve_target": "mid",
-                "sleeve_modifier": Decimal("0.70"),  # 70% of max
-                "new_positions_allowed": True,
-                "aggressive_rebalancing": False,
-                "root_bias": Decimal("0.10"),  # Moderate root preference
-                "description": "Maintain current allocations. Wait for clearer signals.",
-            },
-            MacroRegime.DISTRIBUTION: {
-                "sleeve_target": "mid_lower",
-                "sleeve_modifier": Decimal("0.55"),  # 55% of max
-                "new_positions_allowed": False,
-                "aggressive_rebalancing": False,
-                "root_bias": Decimal("0.15"),  # Elevated root preference
-                "description": "Reduce exposure. No new positions. Favor exits to root.",
-            },
-            MacroRegime.BEAR: {
-                "sleeve_target": "lower",
-                "sleeve_modifier": Decimal("0.40"),  # 40% of max
-                "new_positions_allowed": False,
-                "aggressive_rebalancing": False,
-                "root_bias": Decimal("0.20"),  # Strong root preference
-                "description": "Defensive posture. Shrink sleeve toward minimum.",
-            },
-            MacroRegime.CAPITULATION: {
-                "sleeve_target": "minimum",
-                "sleeve_modifier": Decimal("0.25"),  # 25% of max
-                "new_positions_allowed": False,
-                "aggressive_rebalancing": False,
-                "root_bias": Decimal("0.25"),  # Maximum root preference
-                "description": "Max defensive. Preserve capital. Only hold highest conviction.",
-            },
-        }
-        return policies.get(regime, policies[MacroRegime.NEUTRAL])
-
+        return self._POLICIES.get(regime, self._POLICIES[MacroRegime.NEUTRAL])
 
     def compute_target_sleeve_allocation(
         self,
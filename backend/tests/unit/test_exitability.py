@@ -4,7 +4,9 @@ Tests the ExitabilityLevel classification and safe position size calculation.
 """
 
 import pytest
+from collections import namedtuple
 from decimal import Decimal
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.strategy.eligibility_gate import (
@@ -14,6 +16,34 @@ from app.services.strategy.eligibility_gate import (
 )
 
 
+# Attribute bag standing in for SlippageSurface rows
+Surface = namedtuple("Surface", ["size_tao", "slippage_pct"])
+
+# Decimal values shared across tests, parsed once at import
+D = MappingProxyType({
+    v: Decimal(v) for v in (
+        "0", "0.01", "0.02", "0.03", "0.04", "0.05", "0.06", "0.07", "0.075",
+        "0.08", "0.085", "0.09", "0.10", "0.12", "0.15", "0.20", "0.25", "10",
+        "30", "50", "100", "200", "300", "500", "700", "1000", "2000", "10000",
+    )
+})
+
+
+def _mock_db(surfaces):
+    """Build an AsyncMock session whose execute() yields the given surfaces."""
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = surfaces
+    db.execute.return_value = result
+    return db
+
+
+@pytest.fixture(scope="module")
+def gate():
+    """Shared EligibilityGate; the gate is stateless after construction."""
+    return EligibilityGate()
+
+
 class TestExitabilityLevel:
     """Test exitability level classification."""
 
@@ -43,15 +73,15 @@ class TestExitabilityResult:
         result = ExitabilityResult(
             netuid=1,
             level=ExitabilityLevel.PASS,
-            slippage_50pct=Decimal("0.02"),
-            slippage_100pct=Decimal("0.04"),
+            slippage_50pct=D["0.02"],
+            slippage_100pct=D["0.04"],
             reason="Slippage acceptable",
         )
 
         assert result.netuid == 1
         assert result.level == ExitabilityLevel.PASS
-        assert result.slippage_50pct == Decimal("0.02")
-        assert result.slippage_100pct == Decimal("0.04")
+        assert result.slippage_50pct == D["0.02"]
+        assert result.slippage_100pct == D["0.04"]
         assert result.safe_size_tao is None
         assert result.trim_amount_tao is None
 
@@ -60,95 +90,89 @@ class TestExitabilityResult:
         result = ExitabilityResult(
             netuid=5,
             level=ExitabilityLevel.FORCE_TRIM,
-            slippage_50pct=Decimal("0.08"),
-            slippage_100pct=Decimal("0.12"),
+            slippage_50pct=D["0.08"],
+            slippage_100pct=D["0.12"],
             reason="100% exit slippage exceeds 10%",
-            current_size_tao=Decimal("1000"),
-            safe_size_tao=Decimal("700"),
-            trim_amount_tao=Decimal("300"),
-            trim_pct=Decimal("30"),
+            current_size_tao=D["1000"],
+            safe_size_tao=D["700"],
+            trim_amount_tao=D["300"],
+            trim_pct=D["30"],
         )
 
         assert result.level == ExitabilityLevel.FORCE_TRIM
-        assert result.safe_size_tao == Decimal("700")
-        assert result.trim_amount_tao == Decimal("300")
-        assert result.trim_pct == Decimal("30")
+        assert result.safe_size_tao == D["700"]
+        assert result.trim_amount_tao == D["300"]
+        assert result.trim_pct == D["30"]
 
 
 class TestSlippageInterpolation:
     """Test slippage interpolation logic."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.gate = EligibilityGate()
-
-    def test_interpolate_empty_surfaces(self):
+    def test_interpolate_empty_surfaces(self, gate):
         """Test interpolation with no data returns default high slippage."""
-        result = self.gate._interpolate_slippage([], Decimal("100"))
-        assert result == Decimal("0.10")
+        result = gate._interpolate_slippage([], D["100"])
+        assert result == D["0.10"]
 
-    def test_interpolate_exact_match(self):
+    def test_interpolate_exact_match(self, gate):
         """Test interpolation when size exactly matches a surface."""
         surfaces = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.01")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.05")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.10")),
+            Surface(D["100"], D["0.01"]),
+            Surface(D["500"], D["0.05"]),
+            Surface(D["1000"], D["0.10"]),
         ]
 
-        result = self.gate._interpolate_slippage(surfaces, Decimal("500"))
-        assert result == Decimal("0.05")
+        result = gate._interpolate_slippage(surfaces, D["500"])
+        assert result == D["0.05"]
 
-    def test_interpolate_between_values(self):
+    def test_interpolate_between_values(self, gate):
         """Test linear interpolation between two surfaces."""
         surfaces = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.01")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.05")),
+            Surface(D["100"], D["0.01"]),
+            Surface(D["500"], D["0.05"]),
         ]
 
         # 300 is halfway between 100 and 500
-        result = self.gate._interpolate_slippage(surfaces, Decimal("300"))
+        result = gate._interpolate_slippage(surfaces, D["300"])
         # Expected: 0.01 + 0.5 * (0.05 - 0.01) = 0.01 + 0.02 = 0.03
-        assert result == Decimal("0.03")
+        assert result == D["0.03"]
 
-    def test_interpolate_below_minimum(self):
+    def test_interpolate_below_minimum(self, gate):
         """Test interpolation for size below smallest surface."""
         surfaces = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.01")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.05")),
+            Surface(D["100"], D["0.01"]),
+            Surface(D["500"], D["0.05"]),
         ]
 
-        result = self.gate._interpolate_slippage(surfaces, Decimal("50"))
+        result = gate._interpolate_slippage(surfaces, D["50"])
         # Should return slippage of smallest size
-        assert result == Decimal("0.01")
+        assert result == D["0.01"]
 
-    def test_interpolate_above_maximum(self):
+    def test_interpolate_above_maximum(self, gate):
         """Test interpolation for size above largest surface."""
         surfaces = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.01")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.05")),
+            Surface(D["100"], D["0.01"]),
+            Surface(D["500"], D["0.05"]),
         ]
 
-        result = self.gate._interpolate_slippage(surfaces, Decimal("1000"))
+        result = gate._interpolate_slippage(surfaces, D["1000"])
         # Should return slippage of largest size
-        assert result == Decimal("0.05")
+        assert result == D["0.05"]
 
 
 class TestExitabilityThresholds:
     """Test exitability threshold logic."""
 
-    def setup_method(self):
-        """Set up test fixtures with default thresholds."""
-        self.gate = EligibilityGate()
-        # Default thresholds from config:
-        # max_exit_slippage_50pct = 0.05 (5%)
-        # max_exit_slippage_100pct = 0.10 (10%)
-        # exitability_warning_threshold = 0.075 (7.5%)
+    def test_thresholds_loaded(self, gate):
+        """Test that thresholds are loaded from config.
 
-    def test_thresholds_loaded(self):
-        """Test that thresholds are loaded from config."""
-        assert self.gate.max_exit_slippage_50pct == Decimal("0.05")
-        assert self.gate.max_exit_slippage_100pct == Decimal("0.10")
-        assert self.gate.exitability_warning_threshold == Decimal("0.075")
+        Default thresholds from config:
+        max_exit_slippage_50pct = 0.05 (5%)
+        max_exit_slippage_100pct = 0.10 (10%)
+        exitability_warning_threshold = 0.075 (7.5%)
+        """
+        assert gate.max_exit_slippage_50pct == D["0.05"]
+        assert gate.max_exit_slippage_100pct == D["0.10"]
+        assert gate.exitability_warning_threshold == D["0.075"]
 
     def test_level_determination_pass(self):
         """Test PASS level when slippage is acceptable."""
@@ -175,9 +199,8 @@ class TestExitabilityThresholds:
 class TestFeatureFlag:
     """Test feature flag behavior."""
 
-    def test_feature_flag_default_off(self):
+    def test_feature_flag_default_off(self, gate):
         """Test that feature flag is off by default."""
-        gate = EligibilityGate()
         # Note: This depends on config default, may need mocking
         # assert gate.enable_exitability_gate == False
 
@@ -191,18 +214,14 @@ class TestFeatureFlag:
 class TestBinarySearchSafeSize:
     """Test binary search for safe position size."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.gate = EligibilityGate()
-
     def test_binary_search_converges(self):
         """Test that binary search converges to a solution."""
         # Create mock surfaces with linear slippage growth
         surfaces = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.01")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.05")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.10")),
-            MagicMock(size_tao=Decimal("2000"), slippage_pct=Decimal("0.20")),
+            Surface(D["100"], D["0.01"]),
+            Surface(D["500"], D["0.05"]),
+            Surface(D["1000"], D["0.10"]),
+            Surface(D["2000"], D["0.20"]),
         ]
 
         # For a position of 1500 TAO with 15% slippage at full exit,
@@ -219,119 +238,66 @@ class TestBinarySearchSafeSize:
 class TestCheckExitabilityAsync:
     """Async tests for check_exitability method."""
 
-    async def test_check_exitability_pass(self):
-        """Test exitability check returns PASS for acceptable slippage."""
-        gate = EligibilityGate()
-
-        # Mock database session and slippage surfaces
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.01")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.03")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.05")),
-        ]
-        mock_db.execute.return_value = mock_result
+    @pytest.mark.parametrize(
+        "surface_points,position_size,expected_level",
+        [
+            # 50% exit (100 TAO) = 1%, 100% exit (200 TAO) = 1.5% => PASS
+            (
+                (("100", "0.01"), ("500", "0.03"), ("1000", "0.05")),
+                "200",
+                ExitabilityLevel.PASS,
+            ),
+            # 50% exit (500 TAO) = 4% (< 5%, not BLOCK_BUY)
+            # 100% exit (1000 TAO) = 8.5% (> 7.5%, < 10%) => WARNING
+            (
+                (("100", "0.02"), ("500", "0.04"), ("1000", "0.085")),
+                "1000",
+                ExitabilityLevel.WARNING,
+            ),
+            # 50% exit (500 TAO) = 6% (> 5%) => BLOCK_BUY
+            (
+                (("100", "0.03"), ("500", "0.06"), ("1000", "0.09")),
+                "1000",
+                ExitabilityLevel.BLOCK_BUY,
+            ),
+            # 100% exit (1000 TAO) = 12% (> 10%) => FORCE_TRIM
+            (
+                (("100", "0.05"), ("500", "0.08"), ("1000", "0.12")),
+                "1000",
+                ExitabilityLevel.FORCE_TRIM,
+            ),
+        ],
+        ids=["pass", "warning", "block_buy", "force_trim"],
+    )
+    async def test_check_exitability_level(
+        self, gate, surface_points, position_size, expected_level
+    ):
+        """Test exitability check classifies each slippage tier correctly."""
+        mock_db = _mock_db([
+            Surface(D[size], D[slip])
+            for size, slip in surface_points
+        ])
 
         result = await gate.check_exitability(
             db=mock_db,
             netuid=1,
-            position_size_tao=Decimal("200"),
+            position_size_tao=D[position_size],
         )
 
-        assert result.level == ExitabilityLevel.PASS
+        assert result.level == expected_level
         assert result.netuid == 1
+        if expected_level == ExitabilityLevel.FORCE_TRIM:
+            # Should have calculated safe size and trim amount
+            assert result.safe_size_tao is not None or result.trim_amount_tao is not None
 
-    async def test_check_exitability_warning(self):
-        """Test exitability check returns WARNING for 7.5-10% slippage at 100% exit.
-
-        WARNING requires:
-        - 50% exit slippage <= 5% (not BLOCK_BUY)
-        - 100% exit slippage > 7.5% and <= 10% (WARNING tier, not FORCE_TRIM)
-        """
-        gate = EligibilityGate()
-
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        # Carefully chosen values so that:
-        # - 50% exit (500 TAO) = 4% slippage (< 5%, not BLOCK_BUY)
-        # - 100% exit (1000 TAO) = 8.5% slippage (> 7.5%, < 10%, WARNING)
-        mock_result.scalars.return_value.all.return_value = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.02")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.04")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.085")),
-        ]
-        mock_db.execute.return_value = mock_result
-
-        result = await gate.check_exitability(
-            db=mock_db,
-            netuid=2,
-            position_size_tao=Decimal("1000"),
-        )
-
-        # 50% exit at 500 TAO = 4% (< 5%, not BLOCK_BUY)
-        # 100% exit at 1000 TAO = 8.5% (> 7.5%, < 10%) => WARNING
-        assert result.level == ExitabilityLevel.WARNING
-
-    async def test_check_exitability_block_buy(self):
-        """Test exitability check returns BLOCK_BUY for high 50% slippage."""
-        gate = EligibilityGate()
-
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.03")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.06")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.09")),
-        ]
-        mock_db.execute.return_value = mock_result
-
-        result = await gate.check_exitability(
-            db=mock_db,
-            netuid=3,
-            position_size_tao=Decimal("1000"),
-        )
-
-        # 50% exit at 500 TAO = 6% slippage (> 5%) => BLOCK_BUY
-        assert result.level == ExitabilityLevel.BLOCK_BUY
-
-    async def test_check_exitability_force_trim(self):
-        """Test exitability check returns FORCE_TRIM for high 100% slippage."""
-        gate = EligibilityGate()
-
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.05")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.08")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.12")),
-        ]
-        mock_db.execute.return_value = mock_result
-
-        result = await gate.check_exitability(
-            db=mock_db,
-            netuid=4,
-            position_size_tao=Decimal("1000"),
-        )
-
-        # 100% exit at 1000 TAO = 12% slippage (> 10%) => FORCE_TRIM
-        assert result.level == ExitabilityLevel.FORCE_TRIM
-        # Should have calculated safe size and trim amount
-        assert result.safe_size_tao is not None or result.trim_amount_tao is not None
-
-    async def test_check_exitability_no_data(self):
+    async def test_check_exitability_no_data(self, gate):
         """Test exitability check handles missing slippage data."""
-        gate = EligibilityGate()
-
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        mock_db.execute.return_value = mock_result
+        mock_db = _mock_db([])
 
         result = await gate.check_exitability(
             db=mock_db,
             netuid=5,
-            position_size_tao=Decimal("100"),
+            position_size_tao=D["100"],
         )
 
         # Should return WARNING when no data available
@@ -343,17 +309,13 @@ class TestCheckExitabilityAsync:
 class TestMinPositionSafetyGuard:
     """Test minimum position safety guard in calculate_safe_position_size."""
 
-    async def test_safe_size_above_minimum_returns_size(self):
+    async def test_safe_size_above_minimum_returns_size(self, gate):
         """Test that safe size above minimum is returned normally."""
-        from app.services.strategy.eligibility_gate import EligibilityGate
-
-        gate = EligibilityGate()
-
         # Mock surfaces where safe size would be ~500 TAO (above min_position_tao=50)
         surfaces = [
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.02")),
-            MagicMock(size_tao=Decimal("500"), slippage_pct=Decimal("0.07")),
-            MagicMock(size_tao=Decimal("1000"), slippage_pct=Decimal("0.15")),
+            Surface(D["100"], D["0.02"]),
+            Surface(D["500"], D["0.07"]),
+            Surface(D["1000"], D["0.15"]),
         ]
 
         mock_db = AsyncMock()
@@ -361,26 +323,22 @@ class TestMinPositionSafetyGuard:
         safe_size = await gate.calculate_safe_position_size(
             db=mock_db,
             netuid=1,
-            current_size_tao=Decimal("1000"),
+            current_size_tao=D["1000"],
             surfaces=surfaces,
         )
 
         # Safe size should be returned (above minimum)
         assert safe_size is not None
-        assert safe_size > Decimal("50")  # Above min_position_tao
+        assert safe_size > D["50"]  # Above min_position_tao
 
-    async def test_safe_size_below_minimum_returns_none(self):
+    async def test_safe_size_below_minimum_returns_none(self, gate):
         """Test that safe size below minimum returns None (full exit)."""
-        from app.services.strategy.eligibility_gate import EligibilityGate
-
-        gate = EligibilityGate()
-
         # Mock surfaces where even smallest size has high slippage
         # This should result in safe_size being very small (below min)
         surfaces = [
-            MagicMock(size_tao=Decimal("10"), slippage_pct=Decimal("0.08")),
-            MagicMock(size_tao=Decimal("50"), slippage_pct=Decimal("0.15")),
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.25")),
+            Surface(D["10"], D["0.08"]),
+            Surface(D["50"], D["0.15"]),
+            Surface(D["100"], D["0.25"]),
         ]
 
         mock_db = AsyncMock()
@@ -388,7 +346,7 @@ class TestMinPositionSafetyGuard:
         safe_size = await gate.calculate_safe_position_size(
             db=mock_db,
             netuid=1,
-            current_size_tao=Decimal("100"),
+            current_size_tao=D["100"],
             surfaces=surfaces,
         )
 
@@ -396,50 +354,39 @@ class TestMinPositionSafetyGuard:
         # because any safe size would be below minimum
         assert safe_size is None
 
-    async def test_force_trim_recommends_full_exit_when_below_min(self):
+    async def test_force_trim_recommends_full_exit_when_below_min(self, gate):
         """Test that FORCE_TRIM recommends 100% trim when safe size below minimum."""
-        from app.services.strategy.eligibility_gate import EligibilityGate, ExitabilityLevel
-
-        gate = EligibilityGate()
-
         # Mock surfaces where safe size would be below minimum
         surfaces = [
-            MagicMock(size_tao=Decimal("10"), slippage_pct=Decimal("0.08")),
-            MagicMock(size_tao=Decimal("50"), slippage_pct=Decimal("0.15")),
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.25")),
+            Surface(D["10"], D["0.08"]),
+            Surface(D["50"], D["0.15"]),
+            Surface(D["100"], D["0.25"]),
         ]
 
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = surfaces
-        mock_db.execute.return_value = mock_result
+        mock_db = _mock_db(surfaces)
 
         result = await gate.check_exitability(
             db=mock_db,
             netuid=1,
-            position_size_tao=Decimal("100"),
+            position_size_tao=D["100"],
         )
 
         # Should be FORCE_TRIM with 100% trim (full exit)
         assert result.level == ExitabilityLevel.FORCE_TRIM
         if result.trim_pct:
             # If trim recommendation exists, should be 100%
-            assert result.trim_pct == Decimal("100")
+            assert result.trim_pct == D["100"]
         if result.safe_size_tao is not None:
-            assert result.safe_size_tao == Decimal("0")
+            assert result.safe_size_tao == D["0"]
 
-    async def test_portfolio_nav_based_minimum(self):
+    async def test_portfolio_nav_based_minimum(self, gate):
         """Test that portfolio NAV is used for percentage-based minimum."""
-        from app.services.strategy.eligibility_gate import EligibilityGate
-
-        gate = EligibilityGate()
-
         # Mock surfaces where safe size would be 100 TAO
         # This is above min_position_tao (50) but might be below 3% of NAV
         surfaces = [
-            MagicMock(size_tao=Decimal("50"), slippage_pct=Decimal("0.05")),
-            MagicMock(size_tao=Decimal("100"), slippage_pct=Decimal("0.07")),
-            MagicMock(size_tao=Decimal("200"), slippage_pct=Decimal("0.12")),
+            Surface(D["50"], D["0.05"]),
+            Surface(D["100"], D["0.07"]),
+            Surface(D["200"], D["0.12"]),
         ]
 
         mock_db = AsyncMock()
@@ -448,9 +395,9 @@ class TestMinPositionSafetyGuard:
         safe_size = await gate.calculate_safe_position_size(
             db=mock_db,
             netuid=1,
-            current_size_tao=Decimal("200"),
+            current_size_tao=D["200"],
             surfaces=surfaces,
-            portfolio_nav_tao=Decimal("10000"),  # 3% = 300 TAO minimum
+            portfolio_nav_tao=D["10000"],  # 3% = 300 TAO minimum
         )
 
         # Safe size (~100 TAO) is below 3% of portfolio (300 TAO)
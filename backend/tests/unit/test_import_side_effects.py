@@ -9,12 +9,61 @@ This test verifies that importing backend modules does not trigger:
 
 If this test fails, it means someone introduced import-time side effects
 that need to be moved to lazy initialization.
+
+Each check runs in a fresh interpreter so that modules can be imported
+cold without evicting them from the test session's sys.modules.
 """
 
+import subprocess
 import sys
-from unittest.mock import patch, MagicMock
+import textwrap
+from pathlib import Path
+
 import pytest
 
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Modules that previously had import-time side effects
+SIDE_EFFECT_GUARDED_MODULES = (
+    # Strategy modules
+    "app.services.strategy.eligibility_gate",
+    "app.services.strategy.strategy_engine",
+    "app.services.strategy.position_sizer",
+    "app.services.strategy.regime_calculator",
+    "app.services.strategy.constraint_enforcer",
+    "app.services.strategy.rebalancer",
+    "app.services.strategy.macro_regime_detector",
+    # Analysis modules
+    "app.services.analysis.slippage_sync",
+    "app.services.analysis.risk_monitor",
+    "app.services.analysis.transaction_sync",
+    "app.services.analysis.nav_calculator",
+    "app.services.analysis.cost_basis",
+    # Data modules
+    "app.services.data.taostats_client",
+    "app.services.data.data_sync",
+    # API modules
+    "app.api.v1.portfolio",
+    "app.api.v1.positions",
+    "app.api.v1.recommendations",
+)
+
+
+def _run_isolated(script: str) -> None:
+    """Run a check script in a fresh interpreter and fail on non-zero exit.
+
+    The script must print "ok" as its last line on success.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        pytest.fail(proc.stderr or proc.stdout)
+    assert proc.stdout.strip().endswith("ok")
+
 
 class TestNoImportSideEffects:
     """Verify that importing modules does not trigger side effects."""
@@ -26,98 +75,52 @@ class TestNoImportSideEffects:
         modules that previously had side effects. If get_settings
         is called at import time, this test will fail.
         """
-        # Track if get_settings was called
-        call_tracker = {"called": False, "caller": None}
-
-        def mock_get_settings():
+        _run_isolated(f"""
+            import importlib
+            import sys
             import traceback
-            call_tracker["called"] = True
-            call_tracker["caller"] = "".join(traceback.format_stack())
-            raise RuntimeError(
-                "get_settings() was called during import! "
-                "This indicates an import-time side effect.\n"
-                f"Call stack:\n{call_tracker['caller']}"
-            )
-
-        # Clear any cached modules that might have already loaded
-        modules_to_clear = [
-            key for key in list(sys.modules.keys())
-            if key.startswith("app.services.") or key.startswith("app.api.")
-        ]
-        for mod in modules_to_clear:
-            del sys.modules[mod]
-
-        # Patch get_settings before importing
-        with patch("app.core.config.get_settings", mock_get_settings):
-            # Import modules that previously had import-time side effects
-            # These should all import cleanly without calling get_settings
-
-            # Strategy modules
-            try:
-                from app.services.strategy import eligibility_gate
-                from app.services.strategy import strategy_engine
-                from app.services.strategy import position_sizer
-                from app.services.strategy import regime_calculator
-                from app.services.strategy import constraint_enforcer
-                from app.services.strategy import rebalancer
-                from app.services.strategy import macro_regime_detector
-            except RuntimeError as e:
-                if "get_settings() was called during import" in str(e):
-                    pytest.fail(f"Strategy module import caused side effect: {e}")
-                raise
-
-            # Analysis modules
-            try:
-                from app.services.analysis import slippage_sync
-                from app.services.analysis import risk_monitor
-                from app.services.analysis import transaction_sync
-                from app.services.analysis import nav_calculator
-                from app.services.analysis import cost_basis
-            except RuntimeError as e:
-                if "get_settings() was called during import" in str(e):
-                    pytest.fail(f"Analysis module import caused side effect: {e}")
-                raise
-
-            # Data modules
-            try:
-                from app.services.data import taostats_client
-                from app.services.data import data_sync
-            except RuntimeError as e:
-                if "get_settings() was called during import" in str(e):
-                    pytest.fail(f"Data module import caused side effect: {e}")
-                raise
-
-            # API modules
-            try:
-                from app.api.v1 import portfolio
-                from app.api.v1 import positions
-                from app.api.v1 import recommendations
-            except RuntimeError as e:
-                if "get_settings() was called during import" in str(e):
-                    pytest.fail(f"API module import caused side effect: {e}")
-                raise
-
-        # If we got here, no side effects occurred
-        assert not call_tracker["called"], "get_settings was called during import"
+            from unittest.mock import patch
+
+            def mock_get_settings():
+                # The stack is only formatted here, on the failure path
+                raise RuntimeError(
+                    "get_settings() was called during import! "
+                    "This indicates an import-time side effect.\\n"
+                    "Call stack:\\n" + "".join(traceback.format_stack())
+                )
+
+            # Patch get_settings before importing
+            with patch("app.core.config.get_settings", mock_get_settings):
+                for name in {SIDE_EFFECT_GUARDED_MODULES!r}:
+                    try:
+                        importlib.import_module(name)
+                    except RuntimeError as e:
+                        if "get_settings() was called during import" in str(e):
+                            sys.exit(f"{{name}} import caused side effect: {{e}}")
+                        raise
+
+            print("ok")
+        """)
 
     def test_core_modules_remain_lazy(self):
         """Verify that core database and redis modules use lazy initialization."""
-        # Clear modules
-        for key in list(sys.modules.keys()):
-            if "app.core.database" in key or "app.core.redis" in key:
-                del sys.modules[key]
+        _run_isolated("""
+            from unittest.mock import MagicMock, patch
+
+            with patch("app.core.config.get_settings") as mock_settings:
+                mock_settings.return_value = MagicMock()
 
-        with patch("app.core.config.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock()
+                # Import should not create engine or redis client
+                from app.core import database
+                from app.core import redis
 
-            # Import should not create engine or redis client
-            from app.core import database
-            from app.core import redis
+                # Check that the private variables are None (not yet initialized)
+                assert database._engine is None, "Database engine was created at import time"
+                assert database._async_session_factory is None, "Session factory was created at import time"
+                assert redis._redis_client is None, "Redis client was created at import time"
 
-            # Check that the private variables are None (not yet initialized)
-            assert database._engine is None, "Database engine was created at import time"
-            assert database._async_session_factory is None, "Session factory was created at import time"
-            assert redis._redis_client is None, "Redis client was created at import time"
+            print("ok")
+        """)
 
     def test_lazy_singletons_not_instantiated_on_import(self):
         """Verify lazy singletons are not instantiated at import time.
@@ -125,42 +128,39 @@ class TestNoImportSideEffects:
         This test checks that the internal singleton variables remain None
         after import, confirming lazy initialization is working.
         """
-        # Clear service modules to ensure fresh import
-        modules_to_clear = [
-            key for key in list(sys.modules.keys())
-            if key.startswith("app.services.")
-        ]
-        for mod in modules_to_clear:
-            del sys.modules[mod]
-
-        # Import modules fresh - this should NOT instantiate singletons
-        import app.services.data.taostats_client
-        import app.services.data.data_sync
-        import app.services.analysis.risk_monitor
-        import app.services.analysis.cost_basis
-        import app.services.analysis.transaction_sync
-
-        # Access modules from sys.modules to avoid any name shadowing
-        tc_mod = sys.modules["app.services.data.taostats_client"]
-        ds_mod = sys.modules["app.services.data.data_sync"]
-        rm_mod = sys.modules["app.services.analysis.risk_monitor"]
-        cb_mod = sys.modules["app.services.analysis.cost_basis"]
-        ts_mod = sys.modules["app.services.analysis.transaction_sync"]
-
-        # Verify internal singleton state is None (not yet instantiated)
-        # These will only be set when get_xxx() is called
-        assert tc_mod._taostats_client is None, (
-            "TaoStatsClient was instantiated at import time"
-        )
-        assert ds_mod._data_sync_service is None, (
-            "DataSyncService was instantiated at import time"
-        )
-        assert rm_mod._risk_monitor is None, (
-            "RiskMonitor was instantiated at import time"
-        )
-        assert cb_mod._cost_basis_service is None, (
-            "CostBasisService was instantiated at import time"
-        )
-        assert ts_mod._transaction_sync_service is None, (
-            "TransactionSyncService was instantiated at import time"
-        )
+        _run_isolated("""
+            import sys
+
+            import app.services.data.taostats_client
+            import app.services.data.data_sync
+            import app.services.analysis.risk_monitor
+            import app.services.analysis.cost_basis
+            import app.services.analysis.transaction_sync
+
+            # Access modules from sys.modules to avoid any name shadowing
+            tc_mod = sys.modules["app.services.data.taostats_client"]
+            ds_mod = sys.modules["app.services.data.data_sync"]
+            rm_mod = sys.modules["app.services.analysis.risk_monitor"]
+            cb_mod = sys.modules["app.services.analysis.cost_basis"]
+            ts_mod = sys.modules["app.services.analysis.transaction_sync"]
+
+            # Verify internal singleton state is None (not yet instantiated)
+            # These will only be set when get_xxx() is called
+            assert tc_mod._taostats_client is None, (
+                "TaoStatsClient was instantiated at import time"
+            )
+            assert ds_mod._data_sync_service is None, (
+                "DataSyncService was instantiated at import time"
+            )
+            assert rm_mod._risk_monitor is None, (
+                "RiskMonitor was instantiated at import time"
+            )
+            assert cb_mod._cost_basis_service is None, (
+                "CostBasisService was instantiated at import time"
+            )
+            assert ts_mod._transaction_sync_service is None, (
+                "TransactionSyncService was instantiated at import time"
+            )
+
+            print("ok")
+        """)
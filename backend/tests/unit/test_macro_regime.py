@@ -4,6 +4,7 @@ Tests the portfolio-level market regime classifier that uses
 aggregate signals to determine overall market conditions.
 """
 
+import copy
 import os
 import pytest
 from decimal import Decimal
@@ -19,14 +20,78 @@ sys.path.insert(0, str(backend_path))
 os.environ.setdefault("TAOSTATS_API_KEY", "test_api_key")
 os.environ.setdefault("WALLET_ADDRESS", "test_wallet_address")
 
+from app.services.strategy.macro_regime_detector import (
+    MacroRegime,
+    MacroRegimeDetector,
+    MacroSignals,
+)
+
+
+# Decimal literals parsed once at import
+_D = Decimal
+D_NEG_015 = _D("-0.15")
+D_NEG_012 = _D("-0.12")
+D_NEG_010 = _D("-0.10")
+D_NEG_005 = _D("-0.05")
+D_NEG_004 = _D("-0.04")
+D_NEG_003 = _D("-0.03")
+D_NEG_001 = _D("-0.01")
+ZERO = _D("0")
+D_001 = _D("0.01")
+D_002 = _D("0.02")
+D_003 = _D("0.03")
+D_004 = _D("0.04")
+D_005 = _D("0.05")
+D_008 = _D("0.08")
+D_010 = _D("0.10")
+D_015 = _D("0.15")
+D_020 = _D("0.20")
+D_025 = _D("0.25")
+D_030 = _D("0.30")
+D_050 = _D("0.50")
+D_060 = _D("0.60")
+D_080 = _D("0.80")
+ONE = _D("1.0")
+D_100K = _D("100000")
+
+# Threshold attributes every detector loads from config
+EXPECTED_THRESHOLDS = frozenset({
+    "bull_flow_threshold",
+    "bear_flow_threshold",
+    "capitulation_flow_threshold",
+    "accumulation_drawdown_min",
+    "accumulation_drawdown_max",
+    "capitulation_drawdown",
+})
+
+
+def _run_sync(coro):
+    """Drive a coroutine that finishes without suspending, no event loop needed."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise AssertionError("Coroutine suspended; expected a synchronous fast path")
+
+
+@pytest.fixture(scope="module")
+def detector_template():
+    """Detector built from config once per module."""
+    return MacroRegimeDetector()
+
+
+@pytest.fixture
+def detector(detector_template):
+    """Per-test copy of the template so threshold overrides don't leak."""
+    return copy.copy(detector_template)
+
 
 class TestMacroRegimeBasics:
     """Test basic macro regime detector setup."""
 
     def test_macro_regime_enum_values(self):
         """Test that MacroRegime enum has all expected values."""
-        from app.services.strategy.macro_regime_detector import MacroRegime
-
         assert MacroRegime.BULL == "bull"
         assert MacroRegime.ACCUMULATION == "accumulation"
         assert MacroRegime.NEUTRAL == "neutral"
@@ -34,25 +99,14 @@ class TestMacroRegimeBasics:
         assert MacroRegime.BEAR == "bear"
         assert MacroRegime.CAPITULATION == "capitulation"
 
-    def test_detector_loads_config(self):
+    def test_detector_loads_config(self, detector):
         """Test that detector loads thresholds from config."""
-        from app.services.strategy.macro_regime_detector import MacroRegimeDetector
-
-        detector = MacroRegimeDetector()
-
         # Should have all threshold attributes
-        assert hasattr(detector, 'bull_flow_threshold')
-        assert hasattr(detector, 'bear_flow_threshold')
-        assert hasattr(detector, 'capitulation_flow_threshold')
-        assert hasattr(detector, 'accumulation_drawdown_min')
-        assert hasattr(detector, 'accumulation_drawdown_max')
-        assert hasattr(detector, 'capitulation_drawdown')
-
-    def test_detector_has_enabled_flag(self):
-        """Test that detector has enable flag."""
-        from app.services.strategy.macro_regime_detector import MacroRegimeDetector
+        missing = EXPECTED_THRESHOLDS - set(detector.thresholds._fields)
+        assert not missing, f"Missing thresholds: {sorted(missing)}"
 
-        detector = MacroRegimeDetector()
+    def test_detector_has_enabled_flag(self, detector):
+        """Test that detector has enable flag."""
         assert hasattr(detector, 'enabled')
         # Default should be False
         assert detector.enabled is False
@@ -63,403 +117,218 @@ class TestMacroSignals:
 
     def test_macro_signals_creation(self):
         """Test creating MacroSignals with all fields."""
-        from app.services.strategy.macro_regime_detector import MacroSignals
-
         signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.05"),
-            aggregate_flow_14d=Decimal("0.03"),
-            drawdown_from_ath=Decimal("0.08"),
+            aggregate_flow_7d=D_005,
+            aggregate_flow_14d=D_003,
+            drawdown_from_ath=D_008,
             regime_distribution={"neutral": 5, "risk_on": 3},
-            risk_off_pct=Decimal("0.10"),
+            risk_off_pct=D_010,
             total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
+            total_liquidity_tao=D_100K,
         )
 
-        assert signals.aggregate_flow_7d == Decimal("0.05")
-        assert signals.drawdown_from_ath == Decimal("0.08")
+        # Classifier inputs are converted to float on construction
+        assert signals.aggregate_flow_7d == 0.05
+        assert signals.drawdown_from_ath == 0.08
         assert signals.total_subnets == 10
 
 
-class TestCapitulationRegime:
-    """Test CAPITULATION regime detection."""
-
-    def test_capitulation_severe_drawdown_and_outflow(self):
-        """Test capitulation detected with severe drawdown + outflow."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
+def _signals(flow_7d, flow_14d, drawdown, risk_off_pct, distribution):
+    """Build MacroSignals for a 10-subnet market with 100k TAO liquidity."""
+    return MacroSignals(
+        aggregate_flow_7d=flow_7d,
+        aggregate_flow_14d=flow_14d,
+        drawdown_from_ath=drawdown,
+        regime_distribution=distribution,
+        risk_off_pct=risk_off_pct,
+        total_subnets=10,
+        total_liquidity_tao=D_100K,
+    )
+
+
+# (thresholds, signals, expected regime, expected confidence, reason substring)
+# Signal args: flow_7d, flow_14d, drawdown, risk_off_pct, distribution
+CLASSIFICATION_CASES = [
+    # CAPITULATION: severe drawdown + severe outflow
+    pytest.param(
+        {"capitulation_drawdown": D_025,
+         "capitulation_flow_threshold": D_NEG_010},
+        _signals(D_NEG_015, D_NEG_012, D_030, D_080,
+                 {"risk_off": 8, "neutral": 2}),
+        MacroRegime.CAPITULATION, "high", "drawdown",
+        id="capitulation_severe_drawdown_and_outflow",
+    ),
+    # Only drawdown (moderate outflow): BEAR, not CAPITULATION
+    pytest.param(
+        {"capitulation_drawdown": D_025,
+         "capitulation_flow_threshold": D_NEG_010,
+         "bear_flow_threshold": D_NEG_003},
+        _signals(D_NEG_005, D_NEG_003, D_030, D_050,
+                 {"risk_off": 5, "neutral": 5}),
+        MacroRegime.BEAR, None, None,
+        id="no_capitulation_with_only_drawdown",
+    ),
+    # BULL: strong inflows, both 7d and 14d strong
+    pytest.param(
+        {"bull_flow_threshold": D_003,
+         "accumulation_drawdown_min": D_010},
+        _signals(D_005, D_004, D_003, ZERO,
+                 {"risk_on": 7, "neutral": 3}),
+        MacroRegime.BULL, "high", None,
+        id="bull_strong_inflows_low_drawdown",
+    ),
+    # BULL with weaker 14d flow
+    pytest.param(
+        {"bull_flow_threshold": D_003,
+         "accumulation_drawdown_min": D_010},
+        _signals(D_005, D_001, D_005, ZERO,
+                 {"risk_on": 5, "neutral": 5}),
+        MacroRegime.BULL, "medium", None,
+        id="bull_medium_confidence",
+    ),
+    # Inflows but in drawdown zone: ACCUMULATION instead of BULL
+    pytest.param(
+        {"bull_flow_threshold": D_003,
+         "accumulation_drawdown_min": D_010,
+         "accumulation_drawdown_max": D_025},
+        _signals(D_005, D_004, D_015, ZERO,
+                 {"risk_on": 5, "neutral": 5}),
+        MacroRegime.ACCUMULATION, None, None,
+        id="no_bull_with_high_drawdown",
+    ),
+    # BEAR: negative flows, not severe drawdown
+    pytest.param(
+        {"bear_flow_threshold": D_NEG_003,
+         "capitulation_drawdown": D_025,
+         "capitulation_flow_threshold": D_NEG_010},
+        _signals(D_NEG_005, D_NEG_004, D_010, D_060,
+                 {"risk_off": 6, "neutral": 4}),
+        MacroRegime.BEAR, "high", None,
+        id="bear_negative_flows",
+    ),
+    # BEAR: mild outflow but 50% of subnets risk-off or worse
+    pytest.param(
+        {"bear_flow_threshold": D_NEG_003,
+         "bull_flow_threshold": D_003},
+        _signals(D_NEG_001, ZERO, D_005, D_050,
+                 {"risk_off": 4, "quarantine": 1, "neutral": 5}),
+        MacroRegime.BEAR, None, "risk-off",
+        id="bear_from_high_risk_off_concentration",
+    ),
+    # ACCUMULATION: drawdown zone with mild positive flow
+    pytest.param(
+        {"accumulation_drawdown_min": D_010,
+         "accumulation_drawdown_max": D_025,
+         "bear_flow_threshold": D_NEG_003,
+         "bull_flow_threshold": D_003},
+        _signals(D_001, ZERO, D_015, D_020,
+                 {"neutral": 6, "risk_on": 2, "risk_off": 2}),
+        MacroRegime.ACCUMULATION, None, "drawdown zone",
+        id="accumulation_in_drawdown_zone_with_positive_flow",
+    ),
+    # ACCUMULATION: stabilizing (mildly negative, not bear) flows
+    pytest.param(
+        {"accumulation_drawdown_min": D_010,
+         "accumulation_drawdown_max": D_025,
+         "bear_flow_threshold": D_NEG_003},
+        _signals(D_NEG_001, D_NEG_005, D_020, D_030,
+                 {"neutral": 5, "risk_off": 3, "risk_on": 2}),
+        MacroRegime.ACCUMULATION, "medium", None,
+        id="accumulation_stabilizing_after_decline",
+    ),
+    # DISTRIBUTION: near highs, 14d > 7d = decelerating
+    pytest.param(
+        {"bull_flow_threshold": D_003,
+         "bear_flow_threshold": D_NEG_003,
+         "accumulation_drawdown_min": D_010},
+        _signals(D_001, D_002, D_005, D_020,
+                 {"neutral": 5, "risk_on": 3, "risk_off": 2}),
+        MacroRegime.DISTRIBUTION, None, "decelerating",
+        id="distribution_near_highs_slowing_flows",
+    ),
+    # NEUTRAL: mild positive, 7d == 14d (not decelerating), low drawdown
+    pytest.param(
+        {"bull_flow_threshold": D_003,
+         "bear_flow_threshold": D_NEG_003,
+         "accumulation_drawdown_min": D_010},
+        _signals(D_001, D_001, D_005, D_020,
+                 {"neutral": 5, "risk_on": 3, "risk_off": 2}),
+        MacroRegime.NEUTRAL, "low", None,
+        id="neutral_mixed_signals",
+    ),
+]
+
+
+class TestClassifyRegime:
+    """Test regime classification across all macro regimes."""
+
+    @pytest.mark.parametrize(
+        "thresholds,signals,expected_regime,expected_confidence,reason_substr",
+        CLASSIFICATION_CASES,
+    )
+    def test_classify_regime(
+        self, detector, thresholds, signals,
+        expected_regime, expected_confidence, reason_substr,
+    ):
+        """Test classify_regime picks the expected regime for each signal set."""
         detector.enabled = True
-        detector.capitulation_drawdown = Decimal("0.25")
-        detector.capitulation_flow_threshold = Decimal("-0.10")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("-0.15"),  # Severe outflow
-            aggregate_flow_14d=Decimal("-0.12"),
-            drawdown_from_ath=Decimal("0.30"),   # Severe drawdown
-            regime_distribution={"risk_off": 8, "neutral": 2},
-            risk_off_pct=Decimal("0.80"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.CAPITULATION
-        assert result.confidence == "high"
-        assert "drawdown" in result.reason.lower()
-
-    def test_no_capitulation_with_only_drawdown(self):
-        """Test capitulation NOT detected with only drawdown (no severe outflow)."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.capitulation_drawdown = Decimal("0.25")
-        detector.capitulation_flow_threshold = Decimal("-0.10")
-        detector.bear_flow_threshold = Decimal("-0.03")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("-0.05"),  # Moderate outflow (not severe)
-            aggregate_flow_14d=Decimal("-0.03"),
-            drawdown_from_ath=Decimal("0.30"),   # Severe drawdown
-            regime_distribution={"risk_off": 5, "neutral": 5},
-            risk_off_pct=Decimal("0.50"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        # Should be BEAR (has outflow) but not CAPITULATION
-        assert result.regime == MacroRegime.BEAR
-        assert result.regime != MacroRegime.CAPITULATION
-
-
-class TestBullRegime:
-    """Test BULL regime detection."""
-
-    def test_bull_strong_inflows_low_drawdown(self):
-        """Test bull detected with strong inflows and low drawdown."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bull_flow_threshold = Decimal("0.03")
-        detector.accumulation_drawdown_min = Decimal("0.10")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.05"),   # Strong inflow
-            aggregate_flow_14d=Decimal("0.04"),  # Sustained
-            drawdown_from_ath=Decimal("0.03"),   # Low drawdown
-            regime_distribution={"risk_on": 7, "neutral": 3},
-            risk_off_pct=Decimal("0"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
+        detector.thresholds = detector.thresholds._replace(
+            **{name: float(value) for name, value in thresholds.items()}
         )
 
         result = detector.classify_regime(signals)
 
-        assert result.regime == MacroRegime.BULL
-        assert result.confidence == "high"  # Both 7d and 14d strong
-
-    def test_bull_medium_confidence(self):
-        """Test bull with medium confidence when 14d not as strong."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bull_flow_threshold = Decimal("0.03")
-        detector.accumulation_drawdown_min = Decimal("0.10")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.05"),   # Strong inflow
-            aggregate_flow_14d=Decimal("0.01"),  # Weaker 14d
-            drawdown_from_ath=Decimal("0.05"),
-            regime_distribution={"risk_on": 5, "neutral": 5},
-            risk_off_pct=Decimal("0"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.BULL
-        assert result.confidence == "medium"
-
-    def test_no_bull_with_high_drawdown(self):
-        """Test bull NOT detected with high drawdown despite inflows."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bull_flow_threshold = Decimal("0.03")
-        detector.accumulation_drawdown_min = Decimal("0.10")
-        detector.accumulation_drawdown_max = Decimal("0.25")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.05"),   # Strong inflow
-            aggregate_flow_14d=Decimal("0.04"),
-            drawdown_from_ath=Decimal("0.15"),   # In drawdown zone
-            regime_distribution={"risk_on": 5, "neutral": 5},
-            risk_off_pct=Decimal("0"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        # Should be ACCUMULATION instead (in drawdown zone with positive flows)
-        assert result.regime == MacroRegime.ACCUMULATION
-
-
-class TestBearRegime:
-    """Test BEAR regime detection."""
-
-    def test_bear_negative_flows(self):
-        """Test bear detected with negative flows."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bear_flow_threshold = Decimal("-0.03")
-        detector.capitulation_drawdown = Decimal("0.25")
-        detector.capitulation_flow_threshold = Decimal("-0.10")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("-0.05"),  # Negative flow
-            aggregate_flow_14d=Decimal("-0.04"),
-            drawdown_from_ath=Decimal("0.10"),   # Not severe
-            regime_distribution={"risk_off": 6, "neutral": 4},
-            risk_off_pct=Decimal("0.60"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.BEAR
-        assert result.confidence == "high"
-
-    def test_bear_from_high_risk_off_concentration(self):
-        """Test bear detected from high risk-off subnet concentration."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bear_flow_threshold = Decimal("-0.03")
-        detector.bull_flow_threshold = Decimal("0.03")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("-0.01"),  # Mild negative (not bear threshold)
-            aggregate_flow_14d=Decimal("0"),
-            drawdown_from_ath=Decimal("0.05"),
-            regime_distribution={"risk_off": 4, "quarantine": 1, "neutral": 5},
-            risk_off_pct=Decimal("0.50"),  # 50% in risk-off+
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.BEAR
-        assert "risk-off" in result.reason.lower()
-
-
-class TestAccumulationRegime:
-    """Test ACCUMULATION regime detection."""
-
-    def test_accumulation_in_drawdown_zone_with_positive_flow(self):
-        """Test accumulation detected in drawdown zone with positive flows."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.accumulation_drawdown_min = Decimal("0.10")
-        detector.accumulation_drawdown_max = Decimal("0.25")
-        detector.bear_flow_threshold = Decimal("-0.03")
-        detector.bull_flow_threshold = Decimal("0.03")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.01"),   # Mild positive
-            aggregate_flow_14d=Decimal("0"),
-            drawdown_from_ath=Decimal("0.15"),   # In accumulation zone
-            regime_distribution={"neutral": 6, "risk_on": 2, "risk_off": 2},
-            risk_off_pct=Decimal("0.20"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.ACCUMULATION
-        assert "drawdown zone" in result.reason.lower()
-
-    def test_accumulation_stabilizing_after_decline(self):
-        """Test accumulation with stabilizing flows (not positive yet)."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.accumulation_drawdown_min = Decimal("0.10")
-        detector.accumulation_drawdown_max = Decimal("0.25")
-        detector.bear_flow_threshold = Decimal("-0.03")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("-0.01"),  # Mild negative (but not bear)
-            aggregate_flow_14d=Decimal("-0.05"),
-            drawdown_from_ath=Decimal("0.20"),   # In accumulation zone
-            regime_distribution={"neutral": 5, "risk_off": 3, "risk_on": 2},
-            risk_off_pct=Decimal("0.30"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.ACCUMULATION
-        assert result.confidence == "medium"  # Flows not positive yet
-
-
-class TestDistributionRegime:
-    """Test DISTRIBUTION regime detection."""
-
-    def test_distribution_near_highs_slowing_flows(self):
-        """Test distribution detected near highs with decelerating flows."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bull_flow_threshold = Decimal("0.03")
-        detector.bear_flow_threshold = Decimal("-0.03")
-        detector.accumulation_drawdown_min = Decimal("0.10")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.01"),   # Mild positive (not bull)
-            aggregate_flow_14d=Decimal("0.02"),  # 14d > 7d = decelerating
-            drawdown_from_ath=Decimal("0.05"),   # Near highs
-            regime_distribution={"neutral": 5, "risk_on": 3, "risk_off": 2},
-            risk_off_pct=Decimal("0.20"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.DISTRIBUTION
-        assert "decelerating" in result.reason.lower()
-
-
-class TestNeutralRegime:
-    """Test NEUTRAL regime detection."""
-
-    def test_neutral_mixed_signals(self):
-        """Test neutral returned for mixed/unclear signals."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroSignals, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        detector.enabled = True
-        detector.bull_flow_threshold = Decimal("0.03")
-        detector.bear_flow_threshold = Decimal("-0.03")
-        detector.accumulation_drawdown_min = Decimal("0.10")
-
-        signals = MacroSignals(
-            aggregate_flow_7d=Decimal("0.01"),   # Mild positive
-            aggregate_flow_14d=Decimal("0.01"),  # Same = not decelerating
-            drawdown_from_ath=Decimal("0.05"),   # Low drawdown
-            regime_distribution={"neutral": 5, "risk_on": 3, "risk_off": 2},
-            risk_off_pct=Decimal("0.20"),
-            total_subnets=10,
-            total_liquidity_tao=Decimal("100000"),
-        )
-
-        result = detector.classify_regime(signals)
-
-        assert result.regime == MacroRegime.NEUTRAL
-        assert result.confidence == "low"
+        assert result.regime == expected_regime
+        if expected_confidence is not None:
+            assert result.confidence == expected_confidence
+        if reason_substr is not None:
+            assert reason_substr in result.reason.lower()
+
+
+# Selected policy values that pin the aggressive and defensive extremes
+POLICY_EXPECTATIONS = {
+    MacroRegime.BULL: {
+        "sleeve_target": "upper",
+        "new_positions_allowed": True,
+        "sleeve_modifier": ONE,
+    },
+    MacroRegime.CAPITULATION: {
+        "sleeve_target": "minimum",
+        "new_positions_allowed": False,
+        "sleeve_modifier": D_025,
+        "root_bias": D_025,
+    },
+}
+
+REQUIRED_POLICY_KEYS = frozenset({
+    "sleeve_target", "sleeve_modifier", "new_positions_allowed", "root_bias",
+})
 
 
 class TestRegimePolicy:
     """Test policy retrieval for each regime."""
 
-    def test_bull_policy_aggressive(self):
-        """Test bull policy allows expansion and new positions."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        policy = detector.get_regime_policy(MacroRegime.BULL)
+    def test_regime_policies(self, detector):
+        """Test every regime has a complete policy and extremes match expectations."""
+        policies = {regime: detector.get_regime_policy(regime) for regime in MacroRegime}
 
-        assert policy["sleeve_target"] == "upper"
-        assert policy["new_positions_allowed"] is True
-        assert policy["sleeve_modifier"] == Decimal("1.0")
+        for regime, policy in policies.items():
+            missing = REQUIRED_POLICY_KEYS - policy.keys()
+            assert not missing, f"{regime.value} policy missing {sorted(missing)}"
 
-    def test_capitulation_policy_defensive(self):
-        """Test capitulation policy is max defensive."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-        policy = detector.get_regime_policy(MacroRegime.CAPITULATION)
-
-        assert policy["sleeve_target"] == "minimum"
-        assert policy["new_positions_allowed"] is False
-        assert policy["sleeve_modifier"] == Decimal("0.25")
-        assert policy["root_bias"] == Decimal("0.25")
-
-    def test_all_regimes_have_policies(self):
-        """Test all regimes have defined policies."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
-
-        for regime in MacroRegime:
-            policy = detector.get_regime_policy(regime)
-            assert "sleeve_target" in policy
-            assert "sleeve_modifier" in policy
-            assert "new_positions_allowed" in policy
-            assert "root_bias" in policy
+        for regime, expected in POLICY_EXPECTATIONS.items():
+            for key, value in expected.items():
+                assert policies[regime][key] == value, f"{regime.value}.{key}"
 
 
 class TestDisabledDetector:
     """Test behavior when detector is disabled."""
 
-    @pytest.mark.asyncio
-    async def test_disabled_returns_neutral(self):
+    def test_disabled_returns_neutral(self, detector):
         """Test that disabled detector returns neutral."""
-        from app.services.strategy.macro_regime_detector import (
-            MacroRegimeDetector, MacroRegime
-        )
-
-        detector = MacroRegimeDetector()
         detector.enabled = False
 
-        result = await detector.detect_regime()
+        result = _run_sync(detector.detect_regime())
 
         assert result.regime == MacroRegime.NEUTRAL
         assert "disabled" in result.reason.lower()
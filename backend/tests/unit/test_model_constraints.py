@@ -3,6 +3,7 @@
 These tests fail if any model contains prohibited patterns like JSON history columns.
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -15,11 +16,35 @@ from sqlalchemy import inspect
 
 from app.core.database import Base
 
+# Column name fragments that indicate a JSON history column
+PROHIBITED_COLUMN_PATTERNS = (
+    "regime_history_json",
+    "history_json",
+    "_history_json",
+)
+_PROHIBITED_COLUMN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in PROHIBITED_COLUMN_PATTERNS)
+)
+
+
+@pytest.fixture(scope="module")
+def all_columns():
+    """Flatten every mapped column once per module.
+
+    Returns:
+        List of (table_name, column_name, column_type_name, table_has_pk)
+    """
+    return [
+        (table.name, column.name, column.type.__class__.__name__, bool(table.primary_key))
+        for table in (mapper.persist_selectable for mapper in Base.registry.mappers)
+        for column in table.columns
+    ]
+
 
 class TestModelConstraints:
     """Enforce model design constraints."""
 
-    def test_no_json_history_columns(self):
+    def test_no_json_history_columns(self, all_columns):
         """Ensure no model contains JSON history columns.
 
         JSON history columns are an anti-pattern because:
@@ -29,24 +54,12 @@ class TestModelConstraints:
 
         Use separate history/snapshot tables instead.
         """
-        prohibited_patterns = [
-            "regime_history_json",
-            "history_json",
-            "_history_json",
+        violations = [
+            f"{table_name}.{column_name} contains prohibited pattern '{match.group(0)}'"
+            for table_name, column_name, _, _ in all_columns
+            if (match := _PROHIBITED_COLUMN_RE.search(column_name.lower()))
         ]
 
-        violations = []
-
-        for mapper in Base.registry.mappers:
-            table = mapper.persist_selectable
-            for column in table.columns:
-                column_name = column.name.lower()
-                for pattern in prohibited_patterns:
-                    if pattern in column_name:
-                        violations.append(
-                            f"{table.name}.{column.name} contains prohibited pattern '{pattern}'"
-                        )
-
         if violations:
             violation_msg = "\n".join(f"  - {v}" for v in violations)
             pytest.fail(
@@ -54,28 +67,18 @@ class TestModelConstraints:
                 "Use separate history/snapshot tables instead of JSON columns."
             )
 
-    def test_no_jsonb_history_columns(self):
+    def test_no_jsonb_history_columns(self, all_columns):
         """Ensure no model uses JSONB for storing history data.
 
         Same rationale as test_no_json_history_columns - JSONB history
         columns are an anti-pattern.
         """
-        from sqlalchemy.dialects.postgresql import JSONB
-        from sqlalchemy import JSON
-
-        violations = []
-
-        for mapper in Base.registry.mappers:
-            table = mapper.persist_selectable
-            for column in table.columns:
-                column_name = column.name.lower()
-                # Check if column is JSON/JSONB and has "history" in name
-                if hasattr(column.type, '__class__'):
-                    type_name = column.type.__class__.__name__
-                    if type_name in ('JSON', 'JSONB') and 'history' in column_name:
-                        violations.append(
-                            f"{table.name}.{column.name} is {type_name} with 'history' in name"
-                        )
+        # Check if column is JSON/JSONB and has "history" in name
+        violations = [
+            f"{table_name}.{column_name} is {type_name} with 'history' in name"
+            for table_name, column_name, type_name, _ in all_columns
+            if type_name in ('JSON', 'JSONB') and 'history' in column_name.lower()
+        ]
 
         if violations:
             violation_msg = "\n".join(f"  - {v}" for v in violations)
@@ -84,7 +87,7 @@ class TestModelConstraints:
                 "Use separate history/snapshot tables instead."
             )
 
-    def test_models_have_required_metadata(self):
+    def test_models_have_required_metadata(self, all_columns):
         """Verify all models have expected base columns.
 
         Most models should have:
@@ -96,16 +99,14 @@ class TestModelConstraints:
             "alembic_version",
         }
 
-        missing_pk = []
-
-        for mapper in Base.registry.mappers:
-            table = mapper.persist_selectable
-            if table.name in exceptions:
-                continue
-
-            # Check for primary key
-            if not table.primary_key:
-                missing_pk.append(table.name)
+        # Check for primary key (one entry per table, in mapper order)
+        has_pk_by_table = {
+            table_name: has_pk for table_name, _, _, has_pk in all_columns
+        }
+        missing_pk = [
+            table_name for table_name, has_pk in has_pk_by_table.items()
+            if not has_pk and table_name not in exceptions
+        ]
 
         if missing_pk:
             pytest.fail(
@@ -8,11 +8,19 @@ Tests cover:
 - Metrics collection
 """
 
+import time
 import pytest
-from datetime import datetime, timezone, timedelta
+from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
-from unittest.mock import MagicMock, patch, AsyncMock
-import httpx
+from unittest.mock import patch
+from wsgiref.handlers import format_date_time
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Minimal stand-in for httpx.Response; _parse_retry_after only reads headers."""
+    headers: dict
 
 
 class TestRetryAfterParsing:
@@ -23,8 +31,7 @@ class TestRetryAfterParsing:
         from app.services.data.taostats_client import TaoStatsClient
 
         client = TaoStatsClient()
-        response = MagicMock(spec=httpx.Response)
-        response.headers = {"Retry-After": "120"}
+        response = FakeResponse(headers={"Retry-After": "120"})
 
         result = client._parse_retry_after(response)
         assert result == 120
@@ -34,8 +41,7 @@ class TestRetryAfterParsing:
         from app.services.data.taostats_client import TaoStatsClient
 
         client = TaoStatsClient()
-        response = MagicMock(spec=httpx.Response)
-        response.headers = {}
+        response = FakeResponse(headers={})
 
         result = client._parse_retry_after(response)
         assert result is None
@@ -45,8 +51,7 @@ class TestRetryAfterParsing:
         from app.services.data.taostats_client import TaoStatsClient
 
         client = TaoStatsClient()
-        response = MagicMock(spec=httpx.Response)
-        response.headers = {"Retry-After": "invalid-value"}
+        response = FakeResponse(headers={"Retry-After": "invalid-value"})
 
         result = client._parse_retry_after(response)
         assert result is None
@@ -56,11 +61,9 @@ class TestRetryAfterParsing:
         from app.services.data.taostats_client import TaoStatsClient
 
         client = TaoStatsClient()
-        response = MagicMock(spec=httpx.Response)
         # Use a future date
-        future = datetime.now(timezone.utc) + timedelta(seconds=60)
-        http_date = future.strftime("%a, %d %b %Y %H:%M:%S GMT")
-        response.headers = {"Retry-After": http_date}
+        http_date = format_date_time(time.time() + 60)
+        response = FakeResponse(headers={"Retry-After": http_date})
 
         result = client._parse_retry_after(response)
         # Should be approximately 60 seconds (allow some tolerance)
@@ -78,7 +81,7 @@ class TestExponentialBackoff:
         client = TaoStatsClient()
 
         # Get base backoff values (without jitter randomness)
-        with patch('random.uniform', return_value=0):
+        with patch('random.random', return_value=0):
             backoff_0 = client._calculate_backoff(0)
             backoff_1 = client._calculate_backoff(1)
             backoff_2 = client._calculate_backoff(2)
@@ -95,7 +98,7 @@ class TestExponentialBackoff:
         client = TaoStatsClient()
         settings = get_settings()
 
-        with patch('random.uniform', return_value=0):
+        with patch('random.random', return_value=0):
             # Very high attempt number should still be capped
             backoff = client._calculate_backoff(100)
 
@@ -231,6 +234,20 @@ class TestResponseModels:
         assert stake.tao_value == Decimal("5.5")
         assert stake.hotkey_address == "5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY"
 
+    def test_list_adapter_validates_items(self):
+        """Validate a list of items through the cached list adapter."""
+        from app.services.data.response_models import SubnetPoolData, list_adapter
+
+        items = [
+            {"netuid": 1, "price": "1.5"},
+            {"netuid": 2, "price": "0.25"},
+        ]
+
+        pools = list_adapter(SubnetPoolData).validate_python(items)
+        assert [p.netuid for p in pools] == [1, 2]
+        assert pools[1].price_decimal == Decimal("0.25")
+        assert list_adapter(SubnetPoolData) is list_adapter(SubnetPoolData)
+
 
 class TestMetricsCollection:
     """Test metrics collection functionality."""
@@ -243,13 +260,12 @@ class TestMetricsCollection:
         m2 = get_metrics()
         assert m1 is m2
 
-    @pytest.mark.asyncio
-    async def test_record_api_call(self):
+    def test_record_api_call(self):
         """Test recording API call metrics."""
         from app.core.metrics import get_metrics
 
         metrics = get_metrics()
-        await metrics.record_api_call(
+        metrics.record_api_call(
             endpoint="/api/test",
             success=True,
             latency_ms=150.5,
@@ -260,14 +276,13 @@ class TestMetricsCollection:
         assert "api_endpoints" in trust_pack
         assert "/api/test" in trust_pack["api_endpoints"]
 
-    @pytest.mark.asyncio
-    async def test_record_cache_hit_miss(self):
+    def test_record_cache_hit_miss(self):
         """Test recording cache hit/miss metrics."""
         from app.core.metrics import get_metrics
 
         metrics = get_metrics()
-        await metrics.record_cache_hit("test_key")
-        await metrics.record_cache_miss("test_key")
+        metrics.record_cache_hit("test_key")
+        metrics.record_cache_miss("test_key")
 
         trust_pack = metrics.get_trust_pack()
         assert "cache_health" in trust_pack
@@ -312,11 +327,10 @@ class TestPartialFailureProtection:
 
     def test_protection_flag_exists(self):
         """Verify partial failure protection setting exists."""
-        from app.core.config import get_settings
+        from app.core.config import Settings
 
-        settings = get_settings()
-        assert hasattr(settings, 'enable_partial_failure_protection')
-        assert hasattr(settings, 'min_records_for_valid_sync')
+        assert "enable_partial_failure_protection" in Settings.model_fields
+        assert "min_records_for_valid_sync" in Settings.model_fields
 
     def test_min_records_default(self):
         """Verify min records default is reasonable."""
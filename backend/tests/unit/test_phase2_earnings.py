@@ -145,11 +145,10 @@ class TestEarningsServiceConfig:
 
     def test_feature_flag_exists(self):
         """Verify earnings feature flag exists in settings."""
-        from app.core.config import get_settings
+        from app.core.config import Settings
 
-        settings = get_settings()
-        assert hasattr(settings, 'enable_earnings_endpoints')
-        assert hasattr(settings, 'enable_earnings_timeseries_by_netuid')
+        assert "enable_earnings_endpoints" in Settings.model_fields
+        assert "enable_earnings_timeseries_by_netuid" in Settings.model_fields
 
     def test_earnings_service_singleton(self):
         """Verify earnings service is a singleton."""
@@ -165,13 +165,12 @@ class TestReconciliationServiceConfig:
 
     def test_feature_flags_exist(self):
         """Verify reconciliation feature flags exist."""
-        from app.core.config import get_settings
+        from app.core.config import Settings
 
-        settings = get_settings()
-        assert hasattr(settings, 'enable_reconciliation_endpoints')
-        assert hasattr(settings, 'enable_reconciliation_in_trust_pack')
-        assert hasattr(settings, 'reconciliation_absolute_tolerance_tao')
-        assert hasattr(settings, 'reconciliation_relative_tolerance_pct')
+        assert "enable_reconciliation_endpoints" in Settings.model_fields
+        assert "enable_reconciliation_in_trust_pack" in Settings.model_fields
+        assert "reconciliation_absolute_tolerance_tao" in Settings.model_fields
+        assert "reconciliation_relative_tolerance_pct" in Settings.model_fields
 
     def test_tolerance_defaults(self):
         """Verify tolerance defaults are reasonable."""
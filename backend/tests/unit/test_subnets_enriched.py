@@ -11,12 +11,18 @@ Tests cover:
 - Schema validation
 """
 
+import json
+import time
+
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.schemas.subnet import (
+    SPARKLINE_PRICE_SCALE,
     SparklinePoint,
     VolatilePoolData,
     EnrichedSubnetResponse,
@@ -28,53 +34,58 @@ from app.schemas.portfolio import MarketPulse
 # ==================== Sample Data Factories ====================
 
 
-def _make_pool_data(
-    netuid: int = 1,
-    price_change_24h: float = 2.5,
-    price_change_7d: float = 8.1,
-    fear_greed_index: float = 65.0,
-    fear_greed_sentiment: str = "Greed",
-    tao_volume_24h: float = 450.5,
-    tao_buy_volume_24h: float = 280.0,
-    tao_sell_volume_24h: float = 170.5,
-    rank: int = 3,
-    sparkline: Optional[list] = None,
-) -> Dict:
-    """Create a sample TaoStats pool data record."""
-    return {
-        "netuid": netuid,
-        "rank": rank,
-        "price": 0.0045,
-        "price_change_1h": 0.5,
-        "price_change_24h": price_change_24h,
-        "price_change_7d": price_change_7d,
-        "price_change_30d": 15.2,
-        "high_24h": 0.0048,
-        "low_24h": 0.0038,
-        "market_cap": 55000000000000,
-        "market_cap_change_24h": -1.5,
-        "tao_volume_24h": tao_volume_24h,
-        "tao_buy_volume_24h": tao_buy_volume_24h,
-        "tao_sell_volume_24h": tao_sell_volume_24h,
-        "buys_24h": 234,
-        "sells_24h": 189,
-        "buyers_24h": 45,
-        "sellers_24h": 32,
-        "fear_greed_index": fear_greed_index,
-        "fear_greed_sentiment": fear_greed_sentiment,
-        "sparkline_7d": sparkline or [
-            {"timestamp": "2025-01-21T00:00:00Z", "price": 0.0042},
-            {"timestamp": "2025-01-22T00:00:00Z", "price": 0.0044},
-        ],
-        "alpha_in_pool": 274470.73,
-        "alpha_staked": 159947.53,
-        "total_alpha": 434418.27,
-        "root_prop": 0.15,
-        "startup_mode": False,
-        "total_tao": 12345000000000,
-        "total_alpha": 274470730000000,
-        "subnet_name": f"Subnet {netuid}",
-    }
+# Shared, read-only base record in TaoStats' own field names (rao amounts
+# as strings); _make_pool_data copies it per call
+_POOL_TEMPLATE = MappingProxyType({
+    "netuid": 1,
+    "rank": 3,
+    "price": 0.0045,
+    "price_change_1_hour": 0.5,
+    "price_change_1_day": 2.5,
+    "price_change_1_week": 8.1,
+    "price_change_1_month": 15.2,
+    "highest_price_24_hr": 0.0048,
+    "lowest_price_24_hr": 0.0038,
+    "market_cap": "55000000000000",
+    "market_cap_change_1_day": -1.5,
+    "tao_volume_24_hr": "450500000000",
+    "tao_buy_volume_24_hr": "280000000000",
+    "tao_sell_volume_24_hr": "170500000000",
+    "buys_24_hr": 234,
+    "sells_24_hr": 189,
+    "buyers_24_hr": 45,
+    "sellers_24_hr": 32,
+    "fear_and_greed_index": 65.0,
+    "fear_and_greed_sentiment": "Greed",
+    "seven_day_prices": (
+        {"timestamp": "2025-01-21T00:00:00Z", "price": 0.0042},
+        {"timestamp": "2025-01-22T00:00:00Z", "price": 0.0044},
+    ),
+    "alpha_in_pool": "274470730000000",
+    "alpha_staked": "159947530000000",
+    "total_alpha": "434418270000000",
+    "root_prop": 0.15,
+    "startup_mode": False,
+    "total_tao": "12345000000000",
+    "subnet_name": "Subnet 1",
+})
+
+
+def _make_pool_data(**overrides) -> Dict:
+    """Create a sample TaoStats pool data record, overriding template keys."""
+    pool = dict(_POOL_TEMPLATE)
+    # TaoStats sends the sparkline as a list of dicts; copy so tests can't
+    # mutate the shared points
+    pool["seven_day_prices"] = [dict(pt) for pt in _POOL_TEMPLATE["seven_day_prices"]]
+    pool.update(overrides)
+    if "netuid" in overrides:
+        pool["subnet_name"] = f"Subnet {overrides['netuid']}"
+    return pool
+
+
+def _mkresp(**kwargs) -> EnrichedSubnetResponse:
+    """Build an EnrichedSubnetResponse fixture without running validation."""
+    return EnrichedSubnetResponse.model_construct(**kwargs)
 
 
 # ==================== Volatile Extraction Tests ====================
@@ -87,29 +98,29 @@ class TestVolatileExtraction:
         """Verify all 22 volatile fields are extracted correctly."""
         pool = _make_pool_data()
         volatile = VolatilePoolData(
-            price_change_1h=pool.get("price_change_1h"),
-            price_change_24h=pool.get("price_change_24h"),
-            price_change_7d=pool.get("price_change_7d"),
-            price_change_30d=pool.get("price_change_30d"),
-            high_24h=pool.get("high_24h"),
-            low_24h=pool.get("low_24h"),
-            market_cap_change_24h=pool.get("market_cap_change_24h"),
-            tao_volume_24h=pool.get("tao_volume_24h"),
-            tao_buy_volume_24h=pool.get("tao_buy_volume_24h"),
-            tao_sell_volume_24h=pool.get("tao_sell_volume_24h"),
-            buys_24h=pool.get("buys_24h"),
-            sells_24h=pool.get("sells_24h"),
-            buyers_24h=pool.get("buyers_24h"),
-            sellers_24h=pool.get("sellers_24h"),
-            fear_greed_index=pool.get("fear_greed_index"),
-            fear_greed_sentiment=pool.get("fear_greed_sentiment"),
+            price_change_1h=pool.get("price_change_1_hour"),
+            price_change_24h=pool.get("price_change_1_day"),
+            price_change_7d=pool.get("price_change_1_week"),
+            price_change_30d=pool.get("price_change_1_month"),
+            high_24h=pool.get("highest_price_24_hr"),
+            low_24h=pool.get("lowest_price_24_hr"),
+            market_cap_change_24h=pool.get("market_cap_change_1_day"),
+            tao_volume_24h=float(pool["tao_volume_24_hr"]) / 1e9,
+            tao_buy_volume_24h=float(pool["tao_buy_volume_24_hr"]) / 1e9,
+            tao_sell_volume_24h=float(pool["tao_sell_volume_24_hr"]) / 1e9,
+            buys_24h=pool.get("buys_24_hr"),
+            sells_24h=pool.get("sells_24_hr"),
+            buyers_24h=pool.get("buyers_24_hr"),
+            sellers_24h=pool.get("sellers_24_hr"),
+            fear_greed_index=pool.get("fear_and_greed_index"),
+            fear_greed_sentiment=pool.get("fear_and_greed_sentiment"),
             sparkline_7d=[
                 SparklinePoint(timestamp=pt["timestamp"], price=pt["price"])
-                for pt in pool.get("sparkline_7d", [])
+                for pt in pool.get("seven_day_prices", [])
             ],
-            alpha_in_pool=pool.get("alpha_in_pool"),
-            alpha_staked=pool.get("alpha_staked"),
-            total_alpha=pool.get("total_alpha"),
+            alpha_in_pool=float(pool["alpha_in_pool"]) / 1e9,
+            alpha_staked=float(pool["alpha_staked"]) / 1e9,
+            total_alpha=float(pool["total_alpha"]) / 1e9,
             root_prop=pool.get("root_prop"),
             startup_mode=pool.get("startup_mode"),
         )
@@ -149,9 +160,9 @@ class TestVolatileExtraction:
             SparklinePoint(timestamp="2025-01-21T00:00:00Z", price=0.0042),
             SparklinePoint(timestamp="2025-01-22T00:00:00Z", price=0.0044),
         ]
-        assert points[0].timestamp == "2025-01-21T00:00:00Z"
-        assert points[0].price == 0.0042
-        assert points[1].price == 0.0044
+        assert points[0]["timestamp"] == "2025-01-21T00:00:00Z"
+        assert points[0]["price"] == 0.0042
+        assert points[1]["price"] == 0.0044
 
 
 # ==================== Enriched Response Tests ====================
@@ -212,12 +223,12 @@ class TestEnrichedResponse:
     def test_enriched_list_degraded_mode(self):
         """Degraded mode: taostats_available=false, all volatile=null."""
         subnets = [
-            EnrichedSubnetResponse(
+            _mkresp(
                 netuid=1,
                 name="Subnet 1",
                 volatile=None,
             ),
-            EnrichedSubnetResponse(
+            _mkresp(
                 netuid=2,
                 name="Subnet 2",
                 volatile=None,
@@ -236,33 +247,15 @@ class TestEnrichedResponse:
         assert response.cache_age_seconds is None
         assert all(s.volatile is None for s in response.subnets)
 
-    def test_rank_ordering_nulls_last(self):
-        """Subnets should sort by rank with nulls last."""
-        subnets = [
-            EnrichedSubnetResponse(netuid=1, name="A", rank=None),
-            EnrichedSubnetResponse(netuid=2, name="B", rank=3),
-            EnrichedSubnetResponse(netuid=3, name="C", rank=1),
-            EnrichedSubnetResponse(netuid=4, name="D", rank=None),
-            EnrichedSubnetResponse(netuid=5, name="E", rank=2),
-        ]
-
-        sorted_subnets = sorted(subnets, key=lambda x: (x.rank is None, x.rank or 0))
-
-        assert sorted_subnets[0].rank == 1
-        assert sorted_subnets[1].rank == 2
-        assert sorted_subnets[2].rank == 3
-        assert sorted_subnets[3].rank is None
-        assert sorted_subnets[4].rank is None
-
     def test_partial_volatile_data(self):
         """Some subnets have volatile data, others don't."""
         volatile = VolatilePoolData(price_change_24h=5.0)
 
         subnets = [
-            EnrichedSubnetResponse(
+            _mkresp(
                 netuid=1, name="With Data", volatile=volatile,
             ),
-            EnrichedSubnetResponse(
+            _mkresp(
                 netuid=2, name="No Data", volatile=None,
             ),
         ]
@@ -281,19 +274,19 @@ class TestMarketPulse:
     def test_market_pulse_schema(self):
         """MarketPulse schema has expected fields."""
         pulse = MarketPulse(
-            portfolio_24h_change_pct=Decimal("2.3"),
-            portfolio_7d_change_pct=Decimal("8.1"),
-            avg_sentiment_index=Decimal("65.0"),
+            portfolio_24h_change_pct=2.3,
+            portfolio_7d_change_pct=8.1,
+            avg_sentiment_index=65.0,
             avg_sentiment_label="Greed",
-            total_volume_24h_tao=Decimal("450.5"),
-            net_buy_pressure_pct=Decimal("24.2"),
+            total_volume_24h_tao=450.5,
+            net_buy_pressure_pct=24.2,
             top_mover_netuid=5,
             top_mover_name="Subnet 5",
-            top_mover_change_24h=Decimal("12.5"),
+            top_mover_change_24h=12.5,
             taostats_available=True,
         )
 
-        assert pulse.portfolio_24h_change_pct == Decimal("2.3")
+        assert pulse.portfolio_24h_change_pct == 2.3
         assert pulse.avg_sentiment_label == "Greed"
         assert pulse.top_mover_netuid == 5
         assert pulse.taostats_available is True
@@ -321,26 +314,24 @@ class TestMarketPulse:
 
     def test_sentiment_label_mapping(self):
         """Verify sentiment index maps to correct labels."""
+        from app.api.v1.portfolio import _sentiment_label
+
         test_cases = [
             (80.0, "Extreme Greed"),
+            (75.0, "Extreme Greed"),
+            (74.9, "Greed"),
             (60.0, "Greed"),
+            (55.0, "Greed"),
             (50.0, "Neutral"),
+            (45.0, "Neutral"),
             (30.0, "Fear"),
+            (25.0, "Fear"),
+            (24.9, "Extreme Fear"),
             (15.0, "Extreme Fear"),
         ]
 
         for index, expected_label in test_cases:
-            if index >= 75:
-                label = "Extreme Greed"
-            elif index >= 55:
-                label = "Greed"
-            elif index >= 45:
-                label = "Neutral"
-            elif index >= 25:
-                label = "Fear"
-            else:
-                label = "Extreme Fear"
-
+            label = _sentiment_label(index)
             assert label == expected_label, f"Index {index}: expected {expected_label}, got {label}"
 
     def test_net_buy_pressure_calculation(self):
@@ -365,6 +356,92 @@ class TestMarketPulse:
         assert top_mover[0] == "SN2"
         assert top_mover[1] == -8.5
 
+    async def test_compute_market_pulse_large_portfolio(self):
+        """Vectorized aggregation matches a per-position reference for N=500."""
+        from app.api.v1 import portfolio
+
+        positions = [
+            SimpleNamespace(
+                netuid=i, tao_value_mid=Decimal(10 + i % 7), subnet_name=f"Subnet {i}",
+            )
+            for i in range(500)
+        ]
+        pools = [
+            {
+                "netuid": i,
+                "price_change_1_day": None if i % 11 == 0 else ((i * 37) % 41) - 20.5,
+                "price_change_1_week": str((i % 13) - 6),
+                "fear_and_greed_index": "invalid" if i % 5 == 0 else 30 + i % 50,
+                "tao_volume_24_hr": str(1_000_000_000 * (1 + i % 3)),
+                "tao_buy_volume_24_hr": 600_000_000 * (1 + i % 3),
+                "tao_sell_volume_24_hr": 400_000_000 * (1 + i % 3),
+            }
+            # Every third netuid is missing from TaoStats
+            for i in range(500) if i % 3
+        ]
+
+        total_value = sum(float(p.tao_value_mid) for p in positions)
+        by_netuid = {p["netuid"]: p for p in pools}
+        change_24h = change_7d = sentiment = sentiment_weight = 0.0
+        volume = buy = sell = 0.0
+        top = (None, 0.0)
+        for pos in positions:
+            pool = by_netuid.get(pos.netuid)
+            if not pool:
+                continue
+            weight = float(pos.tao_value_mid) / total_value
+            if pool["price_change_1_day"] is not None:
+                change_24h += weight * pool["price_change_1_day"]
+                if abs(pool["price_change_1_day"]) > abs(top[1]):
+                    top = (pos.netuid, pool["price_change_1_day"])
+            change_7d += weight * float(pool["price_change_1_week"])
+            if pool["fear_and_greed_index"] != "invalid":
+                sentiment += weight * pool["fear_and_greed_index"]
+                sentiment_weight += weight
+            volume += float(pool["tao_volume_24_hr"]) / 1e9
+            buy += pool["tao_buy_volume_24_hr"] / 1e9
+            sell += pool["tao_sell_volume_24_hr"] / 1e9
+
+        with patch.object(
+            portfolio.taostats_client, "get_pools_full",
+            AsyncMock(return_value={"data": pools}),
+        ):
+            pulse = await portfolio._compute_market_pulse(positions)
+
+        assert pulse.taostats_available is True
+        assert pulse.portfolio_24h_change_pct == pytest.approx(change_24h, abs=1e-4)
+        assert pulse.portfolio_7d_change_pct == pytest.approx(change_7d, abs=1e-4)
+        assert pulse.avg_sentiment_index == pytest.approx(
+            sentiment / sentiment_weight, abs=0.1
+        )
+        assert pulse.total_volume_24h_tao == pytest.approx(volume, abs=1e-4)
+        assert pulse.net_buy_pressure_pct == pytest.approx(
+            (buy - sell) / volume * 100, abs=0.01
+        )
+        assert (pulse.top_mover_netuid, pulse.top_mover_change_24h) == top
+
+    async def test_compute_market_pulse_no_top_mover_without_changes(self):
+        """Missing or zero 24h changes never produce a top mover."""
+        from app.api.v1 import portfolio
+
+        positions = [
+            SimpleNamespace(netuid=i, tao_value_mid=Decimal(10), subnet_name=f"Subnet {i}")
+            for i in (1, 2)
+        ]
+        pools = [
+            {"netuid": 1, "price_change_1_day": None},
+            {"netuid": 2, "price_change_1_day": 0},
+        ]
+
+        with patch.object(
+            portfolio.taostats_client, "get_pools_full",
+            AsyncMock(return_value={"data": pools}),
+        ):
+            pulse = await portfolio._compute_market_pulse(positions)
+
+        assert pulse.top_mover_netuid is None
+        assert pulse.top_mover_change_24h is None
+
 
 # ==================== _extract_volatile Runtime Tests ====================
 
@@ -378,10 +455,10 @@ class TestExtractVolatileFunction:
 
         pool = _make_pool_data(
             netuid=1,
-            price_change_24h=2.5,
-            fear_greed_index=65.0,
-            fear_greed_sentiment="Greed",
-            tao_volume_24h=450.5,
+            price_change_1_day=2.5,
+            fear_and_greed_index=65.0,
+            fear_and_greed_sentiment="Greed",
+            tao_volume_24_hr="450500000000",
         )
         volatile = _extract_volatile(pool)
 
@@ -401,8 +478,10 @@ class TestExtractVolatileFunction:
         assert volatile.sellers_24h == 32
         assert volatile.fear_greed_index == 65.0
         assert volatile.fear_greed_sentiment == "Greed"
-        assert volatile.sparkline_7d is not None
-        assert len(volatile.sparkline_7d) == 2
+        # Daily samples are evenly spaced, so they ship compacted
+        assert volatile.sparkline_7d is None
+        assert volatile.sparkline_prices_e6 == [4200, 4400]
+        assert volatile.sparkline_interval_s == 86400
         assert volatile.alpha_in_pool == 274470.73
         assert volatile.root_prop == 0.15
         assert volatile.startup_mode is False
@@ -453,7 +532,7 @@ class TestExtractVolatileFunction:
 
         pool = {
             "netuid": 1,
-            "sparkline_7d": [
+            "seven_day_prices": [
                 {"timestamp": "2025-01-21T00:00:00Z", "price": 0.0042},
                 "invalid_entry",
                 42,
@@ -462,8 +541,144 @@ class TestExtractVolatileFunction:
         }
         volatile = _extract_volatile(pool)
 
-        assert volatile.sparkline_7d is not None
-        assert len(volatile.sparkline_7d) == 2
+        # Evenly spaced, so it ships in the compact form
+        assert volatile.sparkline_7d is None
+        assert volatile.sparkline_prices_e6 == [4200, 4400]
+        assert volatile.sparkline_start_ts == int(
+            datetime(2025, 1, 21, tzinfo=timezone.utc).timestamp()
+        )
+        assert volatile.sparkline_interval_s == 86400
+
+    def test_extract_volatile_irregular_sparkline_keeps_points(self):
+        """Unevenly spaced sparklines fall back to timestamped points."""
+        from app.api.v1.subnets import _extract_volatile
+
+        pool = {
+            "netuid": 1,
+            "seven_day_prices": [
+                {"timestamp": "2025-01-21T00:00:00Z", "price": 0.0042},
+                {"timestamp": "2025-01-21T01:00:00Z", "price": 0.0043},
+                {"timestamp": "2025-01-22T00:00:00Z", "price": 0.0044},
+            ],
+        }
+        volatile = _extract_volatile(pool)
+
+        assert volatile.sparkline_prices_e6 is None
+        assert [pt["price"] for pt in volatile.sparkline_7d] == [0.0042, 0.0043, 0.0044]
+
+    def test_compact_sparkline_tolerates_block_jitter(self):
+        """Samples a few seconds off their hourly slot still compact."""
+        from app.api.v1.subnets import _compact_sparkline
+
+        points = [
+            SparklinePoint(timestamp="2025-01-21T00:00:00Z", price=1.0),
+            SparklinePoint(timestamp="2025-01-21T01:00:12Z", price=2.0),
+            SparklinePoint(timestamp="2025-01-21T01:59:48Z", price=3.0),
+            SparklinePoint(timestamp="2025-01-21T03:00:00Z", price=4.0),
+        ]
+
+        prices, _, interval = _compact_sparkline(points)
+
+        assert prices == [1.0, 2.0, 3.0, 4.0]
+        assert interval == 3600
+        assert _compact_sparkline(points[:1]) is None
+        assert _compact_sparkline([SparklinePoint(timestamp="", price=1.0)] * 2) is None
+
+    def test_sparkline_prices_round_trip_through_scale(self):
+        """Quantized sparkline prices decode to within 1e-6 TAO."""
+        from app.api.v1.subnets import _extract_volatile
+
+        raw = [0.0045, 0.00451234, 0.1, 1.2345678, 0.0, 2147.483647]
+        pool = {
+            "netuid": 1,
+            "seven_day_prices": [
+                {"timestamp": f"2025-01-21T{hour:02d}:00:00Z", "price": price}
+                for hour, price in enumerate(raw)
+            ],
+        }
+        volatile = _extract_volatile(pool)
+        scale = EnrichedSubnetListResponse(
+            subnets=[], total=0, eligible_count=0
+        ).price_scale
+
+        assert all(isinstance(p, int) for p in volatile.sparkline_prices_e6)
+        for encoded, price in zip(volatile.sparkline_prices_e6, raw):
+            assert abs(encoded / scale - price) < 1e-6
+
+    @pytest.mark.parametrize("startup_mode", [False, True, "true", "no", 1, 0])
+    def test_extract_volatile_matches_validated_model(self, startup_mode):
+        """model_construct output equals VolatilePoolData validated from raw pool values."""
+        from app.api.v1.subnets import _extract_volatile
+
+        pool = {
+            "netuid": 1,
+            "price_change_1_hour": "0.5",
+            "price_change_1_day": 2.5,
+            "price_change_1_week": "bad",
+            "tao_volume_24_hr": "450500000000",
+            "buys_24_hr": "234",
+            "sells_24_hr": 189.0,
+            "fear_and_greed_index": 65,
+            "fear_and_greed_sentiment": "Greed",
+            "seven_day_prices": [
+                {"timestamp": "2025-01-21T00:00:00Z", "price": "0.0042"},
+                {"timestamp": "2025-01-22T00:00:00Z", "price": 0.0044},
+            ],
+            "alpha_in_pool": "274470730000000",
+            "root_prop": "0.15",
+            "startup_mode": startup_mode,
+        }
+        volatile = _extract_volatile(pool)
+        expected = _validated_volatile(pool)
+
+        sparkline_fields = {
+            "sparkline_7d", "sparkline_prices_e6", "sparkline_start_ts", "sparkline_interval_s",
+        }
+        assert volatile.model_dump(exclude=sparkline_fields) == expected.model_dump(
+            exclude=sparkline_fields
+        )
+        assert volatile.sparkline_prices_e6 == [
+            round(pt["price"] * SPARKLINE_PRICE_SCALE) for pt in expected.sparkline_7d
+        ]
+
+
+def _validated_volatile(pool: Dict) -> VolatilePoolData:
+    """Reference extraction: coerce scalars, then run full pydantic validation."""
+
+    def _num(key: str, cast=float, scale: Optional[float] = None):
+        try:
+            val = cast(pool[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return val / scale if scale else val
+
+    return VolatilePoolData(
+        price_change_1h=_num("price_change_1_hour"),
+        price_change_24h=_num("price_change_1_day"),
+        price_change_7d=_num("price_change_1_week"),
+        price_change_30d=_num("price_change_1_month"),
+        high_24h=_num("highest_price_24_hr"),
+        low_24h=_num("lowest_price_24_hr"),
+        market_cap_change_24h=_num("market_cap_change_1_day"),
+        tao_volume_24h=_num("tao_volume_24_hr", scale=1e9),
+        tao_buy_volume_24h=_num("tao_buy_volume_24_hr", scale=1e9),
+        tao_sell_volume_24h=_num("tao_sell_volume_24_hr", scale=1e9),
+        buys_24h=_num("buys_24_hr", int),
+        sells_24h=_num("sells_24_hr", int),
+        buyers_24h=_num("buyers_24_hr", int),
+        sellers_24h=_num("sellers_24_hr", int),
+        fear_greed_index=_num("fear_and_greed_index"),
+        fear_greed_sentiment=pool.get("fear_and_greed_sentiment"),
+        sparkline_7d=[
+            SparklinePoint(timestamp=pt["timestamp"], price=float(pt["price"]))
+            for pt in pool.get("seven_day_prices", [])
+        ],
+        alpha_in_pool=_num("alpha_in_pool", scale=1e9),
+        alpha_staked=_num("alpha_staked", scale=1e9),
+        total_alpha=_num("total_alpha", scale=1e9),
+        root_prop=_num("root_prop"),
+        startup_mode=pool.get("startup_mode"),
+    )
 
 
 # ==================== Schema Validation Tests ====================
@@ -515,6 +730,18 @@ class TestSchemaValidation:
         fields = DashboardResponse.model_fields
         assert "market_pulse" in fields
 
+    def test_enriched_models_are_frozen(self):
+        """Enriched response models reject mutation after construction."""
+        from pydantic import ValidationError
+
+        volatile = VolatilePoolData(price_change_24h=2.5)
+        response = EnrichedSubnetResponse(netuid=1, name="Subnet 1", volatile=volatile)
+
+        with pytest.raises(ValidationError):
+            volatile.price_change_24h = 3.0
+        with pytest.raises(ValidationError):
+            response.rank = 1
+
     def test_volatile_pool_data_serialization(self):
         """VolatilePoolData serializes to dict correctly."""
         volatile = VolatilePoolData(
@@ -553,3 +780,373 @@ class TestSchemaValidation:
         assert data["cache_age_seconds"] == 30
         assert len(data["subnets"]) == 1
         assert data["subnets"][0]["volatile"]["price_change_24h"] == 5.0
+
+    def test_enriched_list_model_dump_json_matches_json_dumps(self):
+        """The endpoint's model_dump_json body matches the json.dumps path."""
+        response = EnrichedSubnetListResponse(
+            subnets=[
+                EnrichedSubnetResponse(
+                    netuid=1,
+                    name="Subnet 1",
+                    emission_share=Decimal("0.023"),
+                    volatile=VolatilePoolData(
+                        price_change_24h=5.0,
+                        sparkline_7d=[
+                            SparklinePoint(timestamp="2025-01-21T00:00:00Z", price=0.0042),
+                        ],
+                    ),
+                ),
+            ],
+            total=1,
+            eligible_count=1,
+        )
+
+        assert json.loads(response.model_dump_json()) == json.loads(
+            json.dumps(response.model_dump(mode="json"))
+        )
+
+
+# ==================== Enriched Response Cache Tests ====================
+
+
+class FakeCache:
+    """In-memory stand-in for the Redis cache; values round-trip through JSON."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = json.loads(json.dumps(value, default=str))
+
+    async def get_hash(self, key):
+        return self.store.get(key)
+
+    async def set_hash(self, key, mapping, ttl=None):
+        self.store[key] = dict(mapping)
+
+
+def _cached_entry(age_seconds: int, **overrides) -> Dict:
+    """Cache entry holding a one-subnet response generated age_seconds ago."""
+    body = EnrichedSubnetListResponse(
+        subnets=[
+            EnrichedSubnetResponse(
+                netuid=1, name="Subnet 1", volatile=VolatilePoolData(price_change_24h=5.0),
+            ),
+        ],
+        total=1,
+        eligible_count=1,
+        **overrides,
+    )
+    return {
+        "generated_at": time.time() - age_seconds,
+        "etag": '"cached-etag"',
+        "body": body.model_dump_json(),
+    }
+
+
+def _request(headers: Optional[Dict[str, str]] = None) -> SimpleNamespace:
+    """Stand-in for a Request carrying only the given headers."""
+    return SimpleNamespace(headers=headers or {})
+
+
+class TestEnrichedResponseCache:
+    """Test the response cache around the enriched subnets endpoint."""
+
+    async def test_fresh_entry_served_without_rebuild(self):
+        """A fresh cache entry is returned as raw JSON without a rebuild."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        fake.store[subnets._enriched_cache_key(False)] = _cached_entry(5)
+        build = AsyncMock()
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets, "_build_enriched_subnets", build):
+            result = await subnets.list_enriched_subnets(
+                _request(), db=None, eligible_only=False,
+            )
+
+        build.assert_not_called()
+        assert json.loads(result.body)["subnets"][0]["volatile"]["price_change_24h"] == 5.0
+
+    async def test_fresh_entry_reports_its_age(self):
+        """A cache hit reports how old the entry is, keeping the stored ETag."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        fake.store[subnets._enriched_cache_key(False)] = _cached_entry(20, cache_age_seconds=0)
+
+        with patch.object(subnets, "cache", fake):
+            result = await subnets.list_enriched_subnets(
+                _request(), db=None, eligible_only=False,
+            )
+
+        data = json.loads(result.body)
+        assert 20 <= data["cache_age_seconds"] <= 21
+        assert data["subnets"][0]["volatile"]["price_change_24h"] == 5.0
+        assert result.headers["etag"] == '"cached-etag"'
+
+    async def test_rebuild_is_cached_when_taostats_available(self):
+        """A successful rebuild is written back to the cache."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        fresh = EnrichedSubnetListResponse(subnets=[], total=0, eligible_count=0)
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets, "_build_enriched_subnets", AsyncMock(return_value=fresh)):
+            result = await subnets.list_enriched_subnets(
+                _request(), db=None, eligible_only=True,
+            )
+
+        key = subnets._enriched_cache_key(True)
+        assert result.body.decode() == fake.store[key]["body"]
+        assert json.loads(result.body)["total"] == 0
+
+    async def test_stale_entry_served_when_taostats_down(self):
+        """Degraded rebuild falls back to the stale entry, flagged unavailable."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        key = subnets._enriched_cache_key(False)
+        fake.store[key] = _cached_entry(600)
+        degraded = EnrichedSubnetListResponse(
+            subnets=[], total=0, eligible_count=0, taostats_available=False,
+        )
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets, "_build_enriched_subnets", AsyncMock(return_value=degraded)):
+            result = await subnets.list_enriched_subnets(
+                _request(), db=None, eligible_only=False,
+            )
+
+        data = json.loads(result.body)
+        assert data["taostats_available"] is False
+        assert data["cache_age_seconds"] >= 600
+        assert data["subnets"][0]["volatile"]["price_change_24h"] == 5.0
+        # The stale entry is not refreshed by a degraded rebuild
+        assert fake.store[key]["generated_at"] < time.time() - 599
+
+    async def test_cache_age_uses_one_timestamp(self):
+        """Freshness and the stored generation time share one clock reading."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        key = subnets._enriched_cache_key(False)
+        fake.store[key] = _cached_entry(5)
+        later = datetime.now(timezone.utc) + timedelta(minutes=1)
+        clock = SimpleNamespace(now=lambda tz=None: later)
+        fresh = EnrichedSubnetListResponse(subnets=[], total=0, eligible_count=0)
+        build = AsyncMock(return_value=fresh)
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets, "datetime", clock), \
+                patch.object(subnets, "_build_enriched_subnets", build):
+            await subnets.list_enriched_subnets(
+                _request(), db=None, eligible_only=False,
+            )
+
+        # Five seconds old by the wall clock, but stale as of the reading
+        build.assert_awaited_once()
+        assert fake.store[key]["generated_at"] == later.timestamp()
+
+
+class TestEnrichedConditionalGet:
+    """Test ETag / If-None-Match handling on the enriched subnets endpoint."""
+
+    async def test_matching_etag_on_cached_entry_returns_304(self):
+        """A fresh entry whose stored ETag matches is answered with an empty 304."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        fake.store[subnets._enriched_cache_key(False)] = _cached_entry(5)
+        request = _request(headers={"if-none-match": 'W/"other", "cached-etag"'})
+
+        with patch.object(subnets, "cache", fake):
+            result = await subnets.list_enriched_subnets(
+                request, db=None, eligible_only=False,
+            )
+
+        assert result.status_code == 304
+        assert result.body == b""
+        assert result.headers["etag"] == '"cached-etag"'
+
+    async def test_rebuilt_response_carries_body_etag(self):
+        """A rebuild is tagged with a hash of its body, stored alongside it."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        fresh = EnrichedSubnetListResponse(subnets=[], total=0, eligible_count=0)
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets, "_build_enriched_subnets", AsyncMock(return_value=fresh)):
+            result = await subnets.list_enriched_subnets(
+                _request(headers={"if-none-match": '"stale"'}), db=None, eligible_only=False,
+            )
+
+        etag = subnets._body_etag(result.body.decode())
+        assert result.status_code == 200
+        assert result.headers["etag"] == etag
+        assert result.headers["cache-control"] == subnets.ENRICHED_CACHE_CONTROL
+        assert fake.store[subnets._enriched_cache_key(False)]["etag"] == etag
+
+
+class TestVolatileLookupCache:
+    """Test the short-lived cache of extracted TaoStats pool data."""
+
+    async def test_miss_fetches_and_caches_extracted_pools(self):
+        """A miss extracts fetched pools and stores them by netuid."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        fetch = AsyncMock(return_value={"data": [
+            {"netuid": 3, "price_change_1_day": "1.5"},
+            {"price_change_1_day": 9.9},
+        ]})
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets.taostats_client, "get_pools_full", fetch):
+            lookup = await subnets._get_volatile_lookup()
+
+        assert list(lookup) == [3]
+        assert lookup[3].price_change_24h == 1.5
+        assert fake.store[subnets.VOLATILE_CACHE_KEY]["3"]["price_change_24h"] == 1.5
+
+    async def test_hit_skips_fetch(self):
+        """A hit rebuilds the lookup from cache without calling TaoStats."""
+        from app.api.v1 import subnets
+
+        fake = FakeCache()
+        await fake.set(subnets.VOLATILE_CACHE_KEY, {
+            3: VolatilePoolData(
+                price_change_24h=1.5,
+                sparkline_7d=[SparklinePoint(timestamp="2025-01-21T00:00:00Z", price=0.0042)],
+            ).model_dump(),
+        })
+        fetch = AsyncMock()
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets.taostats_client, "get_pools_full", fetch):
+            lookup = await subnets._get_volatile_lookup()
+
+        fetch.assert_not_called()
+        assert lookup[3].price_change_24h == 1.5
+        assert lookup[3].sparkline_7d[0]["price"] == 0.0042
+
+
+def _db_subnet(netuid: int, **overrides):
+    """Stand-in for a Subnet row carrying every stable enriched field."""
+    fields = {
+        name: field.default
+        for name, field in EnrichedSubnetResponse.model_fields.items()
+        if name not in ("volatile", "identity", "dev_activity")
+    }
+    fields.update(netuid=netuid, name=f"Subnet {netuid}", **overrides)
+    return SimpleNamespace(**fields)
+
+
+def _fake_db(rows):
+    """AsyncSession stand-in whose execute() returns ``rows`` as scalars."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestEnrichedMerge:
+    """Test merging DB subnets with TaoStats data by netuid."""
+
+    async def test_merge_matches_pools_by_netuid(self):
+        """100 subnets against 100 shuffled pools, some netuids missing."""
+        from app.api.v1 import subnets
+
+        db = _fake_db([_db_subnet(n, rank=n) for n in range(100)])
+        # Pools arrive out of order, cover only even netuids and add some
+        # netuids that aren't in the DB at all
+        pools = [
+            {"netuid": n, "price_change_1_day": n / 10}
+            for n in reversed(range(0, 150, 2))
+        ]
+
+        with patch.object(subnets, "cache", FakeCache()), \
+                patch.object(subnets.taostats_client, "get_pools_full",
+                             AsyncMock(return_value={"data": pools})), \
+                patch.object(subnets.taostats_client, "get_subnet_identity",
+                             AsyncMock(return_value={"data": []})), \
+                patch.object(subnets.taostats_client, "get_dev_activity",
+                             AsyncMock(return_value={"data": []})):
+            response = await subnets._build_enriched_subnets(db, eligible_only=False)
+
+        assert response.taostats_available is True
+        assert [s.netuid for s in response.subnets] == list(range(100))
+        for s in response.subnets:
+            if s.netuid % 2:
+                assert s.volatile is None
+            else:
+                assert s.volatile.price_change_24h == s.netuid / 10
+
+
+    @pytest.mark.parametrize("eligible_only", [False, True])
+    async def test_query_orders_by_rank_nulls_last(self, eligible_only):
+        """Ranking is done by the DB query, not re-sorted in Python."""
+        from app.api.v1 import subnets
+
+        db = _fake_db([])
+
+        with patch.object(subnets, "_get_volatile_lookup", AsyncMock(return_value={})), \
+                patch.object(subnets.taostats_client, "get_subnet_identity",
+                             AsyncMock(return_value={"data": []})), \
+                patch.object(subnets.taostats_client, "get_dev_activity",
+                             AsyncMock(return_value={"data": []})):
+            await subnets._build_enriched_subnets(db, eligible_only=eligible_only)
+
+        sql = " ".join(str(db.execute.call_args.args[0].compile()).split())
+        assert sql.endswith("ORDER BY subnets.rank ASC NULLS LAST")
+        assert ("WHERE subnets.is_eligible = true" in sql) is eligible_only
+
+
+class TestVolatileRefresher:
+    """Test the scheduled pre-warm of the pool data cache."""
+
+    async def test_failed_refresh_leaves_endpoint_degraded(self):
+        """A failing refresher logs, caches nothing, and requests degrade."""
+        from app.api.v1 import subnets
+        from app.core.scheduler import _run_volatile_refresh
+
+        fake = FakeCache()
+        down = AsyncMock(side_effect=RuntimeError("TaoStats down"))
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets.taostats_client, "get_pools_full", down), \
+                patch.object(subnets.taostats_client, "get_subnet_identity",
+                             AsyncMock(return_value={"data": []})), \
+                patch.object(subnets.taostats_client, "get_dev_activity",
+                             AsyncMock(return_value={"data": []})):
+            await _run_volatile_refresh()
+            response = await subnets._build_enriched_subnets(
+                _fake_db([_db_subnet(1)]), eligible_only=False,
+            )
+
+        assert subnets.VOLATILE_CACHE_KEY not in fake.store
+        assert response.taostats_available is False
+        assert response.subnets[0].volatile is None
+
+    async def test_refresh_warms_cache_for_requests(self):
+        """After a refresh, the request path reads pools from the cache."""
+        from app.api.v1 import subnets
+        from app.core.scheduler import _run_volatile_refresh
+
+        fake = FakeCache()
+        fetch = AsyncMock(return_value={"data": [{"netuid": 1, "price_change_1_day": 4.0}]})
+
+        with patch.object(subnets, "cache", fake), \
+                patch.object(subnets.taostats_client, "get_pools_full", fetch):
+            await _run_volatile_refresh()
+            lookup = await subnets._get_volatile_lookup()
+
+        fetch.assert_awaited_once()
+        assert lookup[1].price_change_24h == 4.0
@@ -1,26 +1,25 @@
 import { LineChart, Line, YAxis } from 'recharts'
-import type { SparklinePoint } from '../../../types'
 
 interface SparklineCellProps {
-  data: SparklinePoint[] | null | undefined
+  prices: number[] | null | undefined
 }
 
-export default function SparklineCell({ data }: SparklineCellProps) {
-  if (!data || data.length === 0) {
+export default function SparklineCell({ prices }: SparklineCellProps) {
+  if (!prices || prices.length === 0) {
     return <span className="text-[#4a6a80]">--</span>
   }
 
-  const trend = data[data.length - 1].price >= data[0].price
+  const trend = prices[prices.length - 1] >= prices[0]
   const color = trend ? '#4ade80' : '#f87171' // green-400 / red-400
 
   // Compute Y domain with padding so small price movements fill the chart height
-  const prices = data.map(d => d.price)
   const min = Math.min(...prices)
   const max = Math.max(...prices)
   const range = max - min
   // Add 10% padding, or if range is near-zero, create artificial range around midpoint
   const padding = range > 0 ? range * 0.1 : min * 0.01 || 0.0001
   const yDomain: [number, number] = [min - padding, max + padding]
+  const data = prices.map(price => ({ price }))
 
   return (
     <div className="flex items-center justify-center">
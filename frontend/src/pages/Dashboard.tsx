@@ -12,6 +12,7 @@ import {
 import { api } from '../services/api'
 import type { Dashboard as DashboardType, EnrichedSubnetListResponse, EnrichedSubnet, VolatilePoolData, PositionSummary, ClosedPosition } from '../types'
 import { formatTao, safeFloat } from '../utils/format'
+import { DEFAULT_PRICE_SCALE, sparklinePrices } from '../utils/sparkline'
 import SortableHeader, { useSortToggle, type SortDirection } from '../components/common/SortableHeader'
 import SparklineCell from '../components/common/cells/SparklineCell'
 import PriceChangeCell from '../components/common/cells/PriceChangeCell'
@@ -718,6 +719,7 @@ export default function Dashboard() {
                         enriched={enriched ?? null}
                         rootLogoUrl={rootEnriched?.identity?.logo_url}
                         v={v}
+                        priceScale={enrichedData?.price_scale ?? DEFAULT_PRICE_SCALE}
                         taoPrice={taoPrice}
                         isExpanded={isExpanded}
                         onToggle={() => setExpandedNetuid(isExpanded ? null : position.netuid)}
@@ -816,6 +818,7 @@ function PositionRow({
   enriched,
   rootLogoUrl,
   v,
+  priceScale,
   taoPrice,
   isExpanded,
   onToggle,
@@ -827,6 +830,7 @@ function PositionRow({
   enriched: EnrichedSubnet | null
   rootLogoUrl?: string | null
   v: VolatilePoolData | null
+  priceScale: number
   taoPrice: number
   isExpanded: boolean
   onToggle: () => void
@@ -883,7 +887,7 @@ function PositionRow({
         {isColVisible('sparkline') && (
           <td className="px-4 py-2.5 text-center">
             <div className="w-36 mx-auto">
-              <SparklineCell data={v?.sparkline_7d} />
+              <SparklineCell prices={sparklinePrices(v, priceScale)} />
             </div>
           </td>
         )}
@@ -4,6 +4,7 @@ import { ChevronRight, ChevronDown, AlertTriangle, Search, SlidersHorizontal, Co
 import { api } from '../services/api'
 import type { EnrichedSubnet, EnrichedSubnetListResponse } from '../types'
 import { formatTao, formatCompact } from '../utils/format'
+import { DEFAULT_PRICE_SCALE, sparklinePrices } from '../utils/sparkline'
 import SortableHeader, { useSortToggle, type SortDirection } from '../components/common/SortableHeader'
 import SparklineCell from '../components/common/cells/SparklineCell'
 import PriceChangeCell from '../components/common/cells/PriceChangeCell'
@@ -552,6 +553,7 @@ export default function Subnets() {
                   <SubnetRow
                     key={subnet.id}
                     subnet={subnet}
+                    priceScale={data?.price_scale ?? DEFAULT_PRICE_SCALE}
                     isExpanded={isExpanded}
                     onToggle={() =>
                       setExpandedNetuid(isExpanded ? null : subnet.netuid)
@@ -571,12 +573,14 @@ export default function Subnets() {
 
 function SubnetRow({
   subnet,
+  priceScale,
   isExpanded,
   onToggle,
   isColVisible,
   colSpan,
 }: {
   subnet: EnrichedSubnet
+  priceScale: number
   isExpanded: boolean
   onToggle: () => void
   isColVisible: (key: ColumnKey) => boolean
@@ -620,7 +624,7 @@ function SubnetRow({
         {/* 7d Sparkline */}
         {isColVisible('sparkline') && (
           <td className="px-2 py-3 align-middle">
-            <SparklineCell data={v?.sparkline_7d} />
+            <SparklineCell prices={sparklinePrices(v, priceScale)} />
           </td>
         )}
 
@@ -186,6 +186,10 @@ export interface VolatilePoolData {
   fear_greed_index: number | null
   fear_greed_sentiment: string | null
   sparkline_7d: SparklinePoint[] | null
+  /** Integer prices; divide by EnrichedSubnetListResponse.price_scale for TAO */
+  sparkline_prices_e6: number[] | null
+  sparkline_start_ts: number | null
+  sparkline_interval_s: number | null
   alpha_in_pool: number | null
   alpha_staked: number | null
   total_alpha: number | null
@@ -233,18 +237,19 @@ export interface EnrichedSubnetListResponse {
   eligible_count: number
   taostats_available: boolean
   cache_age_seconds: number | null
+  price_scale: number
 }
 
 export interface MarketPulse {
-  portfolio_24h_change_pct: string | null
-  portfolio_7d_change_pct: string | null
+  portfolio_24h_change_pct: number | null
+  portfolio_7d_change_pct: number | null
   avg_sentiment_index: number | null
   avg_sentiment_label: string | null
-  total_volume_24h_tao: string | null
-  net_buy_pressure_pct: string | null
+  total_volume_24h_tao: number | null
+  net_buy_pressure_pct: number | null
   top_mover_netuid: number | null
   top_mover_name: string | null
-  top_mover_change_24h: string | null
+  top_mover_change_24h: number | null
   taostats_available: boolean
 }
 
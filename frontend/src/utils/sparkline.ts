@@ -0,0 +1,17 @@
+import type { VolatilePoolData } from '../types'
+
+/** Backend default for EnrichedSubnetListResponse.price_scale. */
+export const DEFAULT_PRICE_SCALE = 1_000_000
+
+/**
+ * 7d sparkline prices in TAO, from the compact integer array (divided by
+ * the response's price_scale) or the timestamped fallback.
+ */
+export function sparklinePrices(
+  v: VolatilePoolData | null | undefined,
+  priceScale: number,
+): number[] | null {
+  if (!v) return null
+  if (v.sparkline_prices_e6) return v.sparkline_prices_e6.map(p => p / priceScale)
+  return v.sparkline_7d?.map(p => p.price) ?? null
+}